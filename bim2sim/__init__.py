@@ -1,26 +1,50 @@
 """bim2sim library"""
 
+import importlib
 import os
 import re
 import sys
 
 import tempfile
 from os.path import expanduser
+from typing import TYPE_CHECKING
 
-from bim2sim.decision.console import ConsoleDecisionHandler
-from bim2sim.decision.decisionhandler import DecisionHandler
-from bim2sim.project import Project
+if TYPE_CHECKING:
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.decision.decisionhandler import DecisionHandler
+    from bim2sim.project import Project
 
 VERSION = '0.1-dev'
 
+# names re-exported on first access, so importing bim2sim (e.g. for
+# 'bim2sim --version') does not pull in the project and kernel stack
+_lazy_imports = {
+    'ConsoleDecisionHandler': 'bim2sim.decision.console',
+    'DecisionHandler': 'bim2sim.decision.decisionhandler',
+    'Project': 'bim2sim.project',
+}
 
-def run_project(project: Project, handler: DecisionHandler):
+
+def __getattr__(name):
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def run_project(project: 'Project', handler: 'DecisionHandler'):
     """Run project using decision handler."""
     return handler.handle(project.run(), project.loaded_decisions)
 
 
 def _debug_run_hvac():
     """Create example project and copy ifc if necessary"""
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), "..\\.."))
     rel_example = 'ExampleFiles/KM_DPM_Vereinshaus_Gruppe62_Heizung_with_pumps.ifc'
     path_ifc = os.path.normpath(os.path.join(path_base, rel_example))
@@ -64,6 +88,9 @@ def _get_debug_project_path(aux):
 
 def _debug_run_bps():
     """Create example project and copy ifc if necessary"""
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
     # rel_example = 'ExampleFiles/AC20-FZK-Haus.ifc'
@@ -82,6 +109,9 @@ def _debug_run_bps():
 
 def _debug_run_bps_ep():
     """Create example project and copy ifc if necessary"""
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
     rel_example = 'ExampleFiles/AC20-FZK-Haus.ifc'
@@ -107,6 +137,9 @@ def _debug_run_bps_ep():
 
 def _test_run_bps_ep(rel_path, temp_project=False):
     """Create example project and copy ifc if necessary. Added for EnergyPlus integration tests"""
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 
     path_ifc = os.path.normpath(os.path.join(path_base, rel_path))
@@ -142,6 +175,8 @@ def _test_run_bps_ep(rel_path, temp_project=False):
 
 def _debug_run_hvac_aixlib():
     """Create example project and copy ifc if necessary"""
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), "..\\.."))
     rel_example = 'ExampleFiles/KM_DPM_Vereinshaus_Gruppe62_Heizung_with_pumps.ifc'
     path_ifc = os.path.normpath(os.path.join(path_base, rel_example))
@@ -157,6 +192,9 @@ def _debug_run_hvac_aixlib():
 
 def _debug_run_cfd():
     """Create example project and copy ifc if necessary"""
+    from bim2sim.decision.console import ConsoleDecisionHandler
+    from bim2sim.project import Project
+
     path_base = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 
     rel_example = 'ExampleFiles/AC20-FZK-Haus.ifc'
@@ -21,18 +21,29 @@ Options:
 import os
 import sys
 
-import docopt
-
 from bim2sim import VERSION, run_project
-from bim2sim.project import Project, FolderStructure
-from bim2sim.decision.console import ConsoleDecisionHandler
 
 
 def commandline_interface():
     """user interface"""
 
+    # answer --help and --version without parsing the usage patterns
+    if len(sys.argv) == 2:
+        if sys.argv[1] in ('-h', '--help'):
+            print(__doc__.strip("\n"))
+            exit(0)
+        if sys.argv[1] in ('-v', '--version'):
+            print(VERSION)
+            exit(0)
+
+    import docopt
+
+    # docopt exits on --help and --version, so heavy imports are done after
     args = docopt.docopt(__doc__, version=VERSION)
 
+    from bim2sim.project import Project, FolderStructure
+    from bim2sim.decision.console import ConsoleDecisionHandler
+
     # arguments
     project = args.get('project')
     load = args.get('load')
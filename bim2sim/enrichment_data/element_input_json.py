@@ -3,14 +3,12 @@ def load_element_ifc(element, ele_ifc, enrich_parameter, parameter_value, datacl
     this function fills a data class object, with the information found in the
     enrichment data, based on the ifc type and year.
     """
-    binding = dataclass.element_bind
-    for a in binding:
-        if binding[a]["ifc_type"] == ele_ifc:
-            for b in binding[a][enrich_parameter]:
-                if b == str(parameter_value):
-                    for c in binding[a][enrich_parameter][b]:
-                        setattr(element, str(c),
-                                binding[a][enrich_parameter][b][c])
+    parameter_value = str(parameter_value)
+    for binding in dataclass.element_bind.values():
+        if binding["ifc_type"] == ele_ifc:
+            attrs = binding[enrich_parameter].get(parameter_value, {})
+            for c in attrs:
+                setattr(element, str(c), attrs[c])
 
 
 def load_element_class(instance, dataclass):
@@ -19,19 +17,16 @@ def load_element_class(instance, dataclass):
     enrichment data, based on the class, parameter and parameter value.
     """
 
-    ele_class = str(instance.__class__)[
-                str(instance.__class__).rfind(".") + 1:str(instance.__class__).rfind("'")]
-    binding = dict(dataclass.element_bind)
-    if ele_class in binding:
-        attrs_enrich = dict(binding[ele_class])
-        del attrs_enrich["class"]
-    else:
+    ele_class = type(instance).__name__
+    binding = dataclass.element_bind.get(ele_class)
+    if binding is None:
         return {}
+    attrs_enrich = {k: v for k, v in binding.items() if k != "class"}
 
     # check if element has enrich parameter-value?
-    for enrich_parameter in attrs_enrich:
-        if hasattr(instance, enrich_parameter):
-            if getattr(instance, enrich_parameter) in attrs_enrich[enrich_parameter]:
-                return attrs_enrich[enrich_parameter][str(getattr(instance, enrich_parameter))]
+    for enrich_parameter, values in attrs_enrich.items():
+        value = getattr(instance, enrich_parameter, None)
+        if value is not None and value in values:
+            return values[str(value)]
 
     return attrs_enrich
@@ -1,11 +1,13 @@
 ﻿"""Package for Modelica export"""
 
-import codecs
+import getpass
 import logging
 import os
+import stat
+import tempfile
 from pathlib import Path
 from threading import Lock
-from typing import Union, Type, Dict, Container, Tuple, Callable
+from typing import Union, Type, Dict, Container, Tuple, Callable, List
 
 import numpy as np
 import pint
@@ -18,12 +20,54 @@ from bim2sim.kernel.element import Element
 
 TEMPLATEPATH = Path(bim2sim.__file__).parent / \
                'assets/templates/modelica/tmplModel.txt'
-# prevent mako newline bug by reading file seperatly
-with open(TEMPLATEPATH) as f:
-    templateStr = f.read()
-template = Template(templateStr)
+
+
+def get_template_module_dir() -> Union[Path, None]:
+    """Return a private per user directory for compiled template modules.
+
+    Mako imports the modules found there, so the directory must not be
+    shared with or writable by other users. Returns None (no caching) if
+    such a directory can not be provided.
+    """
+    try:
+        path = Path(tempfile.gettempdir()) / \
+            ('bim2sim_mako_%s' % getpass.getuser())
+        path.mkdir(mode=0o700, exist_ok=True)
+        path_stat = os.lstat(path)
+    except (OSError, KeyError):
+        return None
+    if not stat.S_ISDIR(path_stat.st_mode):
+        return None
+    if hasattr(os, 'getuid') and (path_stat.st_uid != os.getuid()
+                                  or path_stat.st_mode & 0o077):
+        # owned by another user or accessible by others
+        return None
+    return path
+
+
+def _normalize_newlines(text: str) -> str:
+    """Prevent mako newline bug with windows line endings."""
+    return text.replace('\r\n', '\n')
+
+
+_template = None
 lock = Lock()
 
+
+def get_template() -> Template:
+    """Return the Modelica model template, loading it on first use."""
+    global _template
+    if _template is None:
+        # compiled template modules are cached and reused by later processes
+        module_dir = get_template_module_dir()
+        if module_dir is not None:
+            module_dir = str(module_dir)
+        _template = Template(filename=str(TEMPLATEPATH),
+                             module_directory=module_dir,
+                             input_encoding='utf-8',
+                             preprocessor=_normalize_newlines)
+    return _template
+
 logger = logging.getLogger(__name__)
 user_logger = log.get_user_logger(__name__)
 
@@ -92,7 +136,8 @@ class Model:
     def code(self):
         """returns Modelica code"""
         with lock:
-            return template.render(model=self, unknowns=self.unknown_params())
+            return get_template().render(
+                model=self, unknowns=self.unknown_params())
 
     def unknown_params(self):
         unknown = []
@@ -112,16 +157,19 @@ class Model:
         if not _path.endswith(".mo"):
             _path += ".mo"
 
-        data = self.code()
+        data = self.code().encode('utf-8')
 
         user_logger.info("Saving '%s' to '%s'", self.name, _path)
-        with codecs.open(_path, "w", "utf-8") as file:
+        with open(_path, "wb") as file:
             file.write(data)
 
 
 class Instance:
     """Modelica model instance"""
 
+    __slots__ = ('element', 'position', 'params', 'requested', 'connections',
+                 'guid', 'name', 'comment')
+
     library: str = None
     version = None
     path: str = None
@@ -129,6 +177,21 @@ class Instance:
     lookup: Dict[Type[Element], Type['Instance']] = {}
     dummy: Type['Instance'] = None
     _initialized = False
+    _models: List[Type['Instance']] = []
+
+    def __init_subclass__(cls, **kwargs):
+        """Register models in their library on class definition.
+
+        Direct subclasses of Instance are libraries and get their own list of
+        models. Direct subclasses of a library are added to this list, so
+        init_factory does not need to search for them."""
+        super().__init_subclass__(**kwargs)
+        if Instance in cls.__bases__:
+            cls._models = []
+            return
+        for base in cls.__bases__:
+            if Instance in base.__bases__:
+                base._models.append(cls)
 
     def __init__(self, element: Element):
         self.element = element
@@ -148,9 +211,9 @@ class Instance:
         return clean_string(getattr(self.element, "guid", ""))
 
     def _get_name(self) -> str:
-        name = self.element.__class__.__name__.lower()
+        name = type(self.element).__name__.lower()
         if self.guid:
-            name = name + "_" + self.guid
+            return f"{name}_{self.guid}"
         return name
 
     @staticmethod
@@ -178,7 +241,7 @@ class Instance:
                 logger.error("Attribute library not set for '%s'",
                              library.__name__)
                 raise AssertionError("Library not defined")
-            for cls in library.__subclasses__():
+            for cls in library._models:
                 if cls.represents is None:
                     logger.warning("'%s' represents no model and can't be used",
                                    cls.__name__)
@@ -331,16 +394,20 @@ class Instance:
         if not isinstance(max_value, (pint.Quantity, type(None))):
             raise AssertionError("max_value is no pint quantity with unit")
 
-        def inner_check(value):
-            if not isinstance(value, pint.Quantity):
-                return False
-            if min_value is None and max_value is None:
-                return True
-            if min_value is not None and max_value is None:
-                return min_value <= value
-            if max_value is not None:
-                return value <= max_value
-            return min_value <= value <= max_value
+        # decide on the bounds once instead of on every check
+        if min_value is None and max_value is None:
+            def inner_check(value):
+                return isinstance(value, pint.Quantity)
+        elif max_value is None:
+            def inner_check(value, min_value=min_value):
+                return isinstance(value, pint.Quantity) and min_value <= value
+        elif min_value is None:
+            def inner_check(value, max_value=max_value):
+                return isinstance(value, pint.Quantity) and value <= max_value
+        else:
+            def inner_check(value, min_value=min_value, max_value=max_value):
+                return isinstance(value, pint.Quantity) \
+                    and min_value <= value <= max_value
 
         return inner_check
 
@@ -356,6 +423,7 @@ class Instance:
 
 
 class Dummy(Instance):
+    __slots__ = ()
     path = "Path.to.Dummy"
     represents = elem.Dummy
 
@@ -2,6 +2,8 @@
 from typing import Iterable, Tuple, Dict, Any, Type, List
 import logging
 
+import numpy as np
+
 from bim2sim.kernel.element import ProductBased
 
 
@@ -11,6 +13,8 @@ logger = logging.getLogger(__name__)
 class Filter:
     """Base filter"""
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -52,8 +56,7 @@ class TypeFilter(Filter):
                 logger.info("No entity of type '%s' found", ifc_type)
                 entities = []
 
-            for entity in entities:
-                result[entity] = ifc_type
+            result.update(dict.fromkeys(entities, ifc_type))
 
         return result, unknown_ifc_entities
 
@@ -95,12 +98,15 @@ class TextFilter(Filter):
 
         filter_results = {}
         unknown = []
+        elements_classes = tuple(self.elements_classes)
+        ifc_units = self.ifc_units
+        optional_locations = self.optional_locations
 
         # check matches for all entities on all classes
         for entity in ifc_entities:
-            matches = [cls for cls in self.elements_classes
+            matches = [cls for cls in elements_classes
                        if cls.filter_for_text_fragments(
-                    entity, self.ifc_units, self.optional_locations)]
+                    entity, ifc_units, optional_locations)]
             if matches:
                 filter_results[entity] = matches
             else:
@@ -126,7 +132,12 @@ class TextFilter(Filter):
 
 
 class GeometricFilter(Filter):
-    """Filter based on geometric position"""
+    """Filter based on geometric position
+
+    The limits are stored in bounds, an array of shape (3, 2) holding min and
+    max of x, y and z. Missing limits are stored as -inf and inf."""
+
+    __slots__ = ('bounds',)
 
     def __init__(self, 
             x_min: float = None, x_max: float = None, 
@@ -135,21 +146,19 @@ class GeometricFilter(Filter):
         """None = unlimited"""
         super().__init__()
 
-        assert any([not lim is None for lim in [x_min, x_max, y_min, y_max, z_min, z_max]]), \
+        self.bounds = np.array(
+            [[-np.inf if x_min is None else x_min,
+              np.inf if x_max is None else x_max],
+             [-np.inf if y_min is None else y_min,
+              np.inf if y_max is None else y_max],
+             [-np.inf if z_min is None else z_min,
+              np.inf if z_max is None else z_max]], dtype=np.float64)
+
+        assert np.isfinite(self.bounds).any(), \
             "Filter without limits has no effect."
-        assert (x_min is None or x_max is None) or x_min < x_max, \
-            "Invalid arguments for x_min and x_max"
-        assert (y_min is None or y_max is None) or y_min < y_max, \
-            "Invalid arguments for y_min and y_max"
-        assert (z_min is None or z_max is None) or z_min < z_max, \
-            "Invalid arguments for z_min and z_max"
-
-        self.x_min = x_min
-        self.x_max = x_max
-        self.y_min = y_min
-        self.y_max = y_max
-        self.z_min = z_min
-        self.z_max = z_max
+        for axis, (lim_min, lim_max) in zip('xyz', self.bounds):
+            assert lim_min < lim_max, \
+                "Invalid arguments for %s_min and %s_max" % (axis, axis)
 
     def matches(self, ifcelement):
         __doc__ = super().matches.__doc__
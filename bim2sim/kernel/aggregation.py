@@ -1,10 +1,11 @@
 ﻿"""Module for aggregation and simplifying elements"""
+import hashlib
 import itertools
 import logging
-import math
+from collections import Counter
 from functools import partial
 from typing import Sequence, List, Union, Iterable, Tuple, Set, Dict, Optional, \
-    Any
+    Any, FrozenSet
 
 import networkx as nx
 import numpy as np
@@ -27,10 +28,12 @@ def verify_edge_ports(func):
 
     def wrapper(agg_instance, *args, **kwargs):
         ports = func(agg_instance, *args, **kwargs)
+        elements = set(agg_instance.elements)
         for port in ports:
-            if not port.connection:
+            connection = port.connection
+            if not connection:
                 continue
-            if port.connection.parent in agg_instance.elements:
+            if connection.parent in elements:
                 raise AssertionError("%s (%s) is not an edge port of %s" % (
                     port, port.guid, agg_instance))
         return ports
@@ -46,7 +49,11 @@ class HVACAggregationPort(HVACPort):
         super().__init__(*args, **kwargs)
         # TODO / TBD: DJA: can one Port replace multiple? what about position?
 
-        if not type(originals) == list:
+        # a single port or a sequence of ports, which is copied so the port
+        # does not share the list of the caller
+        if isinstance(originals, (list, tuple)):
+            originals = list(originals)
+        else:
             originals = [originals]
         if not all(isinstance(n, hvac.HVACPort) for n in originals):
             raise TypeError("originals must by HVACPorts")
@@ -83,7 +90,7 @@ class HVACAggregationPort(HVACPort):
 class AggregationMixin:
     guid_prefix = 'Agg'
     multi = ()
-    aggregatable_classes: Set[ProductBased] = set()
+    aggregatable_classes: FrozenSet[ProductBased] = frozenset()
 
     def __init__(self, elements: Sequence[ProductBased], *args, **kwargs):
         if self.aggregatable_classes:
@@ -92,9 +99,10 @@ class AggregationMixin:
             if mismatch:
                 raise AssertionError("Can't aggregate %s from elements: %s" %
                                      (self.__class__.__name__, mismatch))
-        # TODO: make guid reproduceable unique for same aggregation elements
-        #  e.g. hash of all (ordered?) element guids?
-        #  Needed for save/load decisions on aggregations
+        # reproducible guid for same aggregation elements, needed for
+        # save/load decisions on aggregations
+        if not kwargs.get('guid'):
+            kwargs['guid'] = self.get_aggregation_guid(elements)
         self.elements = elements
         for model in self.elements:
             model.aggregation = self
@@ -113,13 +121,29 @@ class AggregationMixin:
         if hasattr(cls, 'predefined_types'):
             logger.warning("Obsolete use of 'predefined_types' in %s" % cls)
 
+    @classmethod
+    def get_aggregation_guid(cls, elements: Iterable[ProductBased]) -> str:
+        """Get guid based on aggregation type and guids of its elements.
+
+        The element guids are sorted, so the same aggregation of the same
+        elements results in the same guid independent of element order.
+        """
+        digest = hashlib.blake2b(digest_size=7)
+        digest.update(cls.__name__.encode())
+        for guid in sorted(ele.guid for ele in elements):
+            digest.update(b'|' + guid.encode())
+        return "{0:0<8s}{1}".format(cls.guid_prefix, digest.hexdigest())
+
     def calc_position(self):
         """Position based on first and last element"""
-        try:
-            return (self.elements[0].position + self.elements[-1].position) / 2
-            # return sum(ele.position for ele in self.elements) / len(self.elements)
-        except:
+        if not self.elements:
+            return None
+        first = self.elements[0].position
+        last = self.elements[-1].position
+        if first is None or last is None:
             return None
+        return (first + last) / 2
+        # return sum(ele.position for ele in self.elements) / len(self.elements)
 
     # def request(self, name):
     #     # broadcast request to all nested elements
@@ -158,12 +182,13 @@ class HVACAggregationMixin(AggregationMixin):
         base_graph: networkx graph that should be searched for aggregations
         match_graph: networkx graph that only holds matches
     """
+    whitelist_classes: FrozenSet[ProductBased] = frozenset()
 
     def __init__(self, base_graph: nx.Graph, match_graph: nx.Graph, *args,
                  **kwargs):
         # make get_ports signature match_graph ProductBased.get_ports
         self.get_ports = partial(self.get_ports, base_graph, match_graph)
-        graph_elements = list(set([node.parent for node in match_graph.nodes]))
+        graph_elements = list({node.parent for node in match_graph.nodes})
         super().__init__(graph_elements, *args, **kwargs)
 
     @verify_edge_ports
@@ -179,22 +204,23 @@ class HVACAggregationMixin(AggregationMixin):
         Returns:
             A list of HVACPort objects representing the edge ports.
         """
-        # edges of g excluding all relations to s
-        e1 = base_graph.subgraph(base_graph.nodes - match_graph.nodes).edges
+        match_nodes = match_graph.nodes
+        # any edge of g excluding all relations to s, without building the
+        # subgraph of all other nodes
+        has_outer_edges = any(
+            u not in match_nodes and v not in match_nodes
+            for u, v in base_graph.edges)
 
         # if graph and match_graph are identical
-        if not e1:
+        if not has_outer_edges:
             # ports with only one connection are edge ports in this case
             edge_ports = [v for v, d in match_graph.degree() if d == 1]
         else:
-            # all edges related to s
-            e2 = base_graph.edges - e1
-            # related to s but not s exclusive
-            e3 = e2 - match_graph.edges
-            # get only edge_ports that belong to the match_graph graph
-            edge_ports = list(
-                set([port for port in [e for x in list(e3) for e in x]
-                     if port in match_graph]))
+            # ports of s with an edge in g that is not an edge of s
+            edge_ports = [port for port in match_nodes
+                          if port in base_graph
+                          and any(not match_graph.has_edge(port, neighbor)
+                                  for neighbor in base_graph.adj[port])]
         ports = [HVACAggregationPort(port, parent=self) for port in edge_ports]
         return ports
 
@@ -211,12 +237,14 @@ class HVACAggregationMixin(AggregationMixin):
             connections: connection list of outer connections.
         """
         ports = [port for element in elements for port in element.ports]
-        mapping = {port: None for port in ports}
+        element_set = set(elements)
+        mapping = dict.fromkeys(ports)
         # TODO: len > 1, optimize
         external_ports = []
         for port in ports:
-            if port.connection and port.connection.parent not in elements:
-                external_ports.append(port.connection)
+            connection = port.connection
+            if connection and connection.parent not in element_set:
+                external_ports.append(connection)
 
         mapping[external_ports[0].connection] = external_ports[1]
         mapping[external_ports[1].connection] = external_ports[0]
@@ -227,11 +255,10 @@ class HVACAggregationMixin(AggregationMixin):
     def get_replacement_mapping(self) \
             -> Dict[HVACPort, Union[HVACAggregationPort, None]]:
         """ Get replacement dict for existing ports."""
-        mapping = {port: None for element in self.elements
-                   for port in element.ports}
-        for port in self.ports:
-            for original in port.originals:
-                mapping[original] = port
+        mapping = dict.fromkeys(itertools.chain.from_iterable(
+            element.ports for element in self.elements))
+        mapping.update((original, port)
+                       for port in self.ports for original in port.originals)
         return mapping
 
     @classmethod
@@ -254,6 +281,36 @@ class HVACAggregationMixin(AggregationMixin):
         raise NotImplementedError(
             "Method %s.find_matches not implemented" % cls.__name__)
 
+    @cached_property
+    def whitelist_elements(self) -> list:
+        """ List of whitelist_classes elements present on the aggregation."""
+        return [ele for ele in self.elements
+                if type(ele) in self.whitelist_classes]
+
+    def _split_pump_elements(self):
+        """ Sets pump_elements and not_pump_elements in a single pass."""
+        pump_elements = []
+        not_pump_elements = []
+        for ele in self.elements:
+            if isinstance(ele, hvac.Pump):
+                pump_elements.append(ele)
+            else:
+                not_pump_elements.append(ele)
+        self.pump_elements = pump_elements
+        self.not_pump_elements = not_pump_elements
+
+    @cached_property
+    def pump_elements(self) -> list:
+        """ List of pump-like elements present on the aggregation."""
+        self._split_pump_elements()
+        return self.pump_elements
+
+    @cached_property
+    def not_pump_elements(self) -> list:
+        """ List of not-pump-like elements present on the aggregation."""
+        self._split_pump_elements()
+        return self.not_pump_elements
+
     def _calc_has_pump(self, name) -> bool:
         """ Determines if aggregation contains pumps.
 
@@ -276,7 +333,7 @@ class PipeStrand(HVACAggregationMixin, hvac.Pipe):
     a medium diameter are calculated based on the aggregated elements to
     maintain meaningful parameters for pressure loss calculations.
     """
-    aggregatable_classes = {hvac.Pipe, hvac.PipeFitting, hvac.Valve}
+    aggregatable_classes = frozenset({hvac.Pipe, hvac.PipeFitting, hvac.Valve})
     multi = ('length', 'diameter')
 
     @classmethod
@@ -293,15 +350,31 @@ class PipeStrand(HVACAggregationMixin, hvac.Pipe):
                 - metas: List of dict with meta information. One element for
                     each match.
         """
-        pipe_strands = HvacGraph.get_type_chains(
-            base_graph.element_graph, cls.aggregatable_classes,
-            include_singles=True)
+        pipe_strands = cls.get_pipe_strand_chains(base_graph)
         matches_graphs = [base_graph.subgraph_from_elements(pipe_strand)
                           for pipe_strand in pipe_strands]
 
         metas = [{} for x in matches_graphs]  # no metadata calculated
         return matches_graphs, metas
 
+    @classmethod
+    def get_pipe_strand_chains(cls, base_graph: HvacGraph) -> List[list]:
+        """ Get the chains of pipe-like elements in HvacGraph.
+
+        The chains are enumerated again for every call, as the graph is
+        merged between the aggregations (e.g. UnderfloorHeating before
+        PipeStrand) and earlier chains may no longer exist.
+
+        Args:
+            base_graph: The Hvac graph to search for chains in.
+
+        Returns:
+            List of consecutive pipe-like elements.
+        """
+        return HvacGraph.get_type_chains(
+            base_graph.element_graph, cls.aggregatable_classes,
+            include_singles=True)
+
     @attribute.multi_calc
     def _calc_avg(self) -> dict:
         """ Calculates the total length and average diameter of all pipe-like
@@ -310,20 +383,28 @@ class PipeStrand(HVACAggregationMixin, hvac.Pipe):
 
         total_length = 0
         avg_diameter = 0
-        diameter_times_length = 0
+        segments = []
 
+        log_ignored = logger.isEnabledFor(logging.WARNING)
         for pipe in self.elements:
-            length = getattr(pipe, "length")
-            diameter = getattr(pipe, "diameter")
+            length = pipe.length
+            diameter = pipe.diameter
             if not (length and diameter):
-                logger.warning("Ignored '%s' in aggregation", pipe)
+                if log_ignored:
+                    logger.warning("Ignored '%s' in aggregation", pipe)
                 continue
 
-            diameter_times_length += diameter * length
-            total_length += length
+            segments.append(
+                (length.m_as(ureg.meter), diameter.m_as(ureg.millimeter)))
 
-        if total_length != 0:
-            avg_diameter = diameter_times_length / total_length
+        if segments:
+            # reduce plain magnitudes instead of summing pint quantities
+            lengths, diameters = np.array(segments, dtype=np.float64).T
+            length_sum = lengths.sum()
+            total_length = length_sum * ureg.meter
+            if length_sum != 0:
+                avg_diameter = (np.dot(diameters, lengths) / length_sum
+                                * ureg.millimeter)
 
         result = dict(
             length=total_length,
@@ -368,9 +449,7 @@ class UnderfloorHeating(PipeStrand):
                 - metas: A list of dict with meta information for each
                     underfloor heating system. One element for each match.
         """
-        chains = HvacGraph.get_type_chains(
-            base_graph.element_graph, cls.aggregatable_classes,
-            include_singles=True)
+        chains = cls.get_pipe_strand_chains(base_graph)
         matches_graphs = []
         metas = []
         for chain in chains:
@@ -416,10 +495,47 @@ class UnderfloorHeating(PipeStrand):
         Returns:
             True, if check succeeds and False if check fails.
         """
-        counts = np.unique(ports_coors[:, 2], return_counts=True)
+        # quantize z coordinates to avoid float equality misses
         # TODO: cluster z coordinates
-        idx_max = np.argmax(counts[1])
-        return counts[1][idx_max] / ports_coors.shape[0] >= tolerance
+        if not ports_coors.shape[0]:
+            return False
+        z_coors = np.round(ports_coors[:, 2], 3)
+        # mode by hashing instead of sorting all z coordinates
+        _, max_count = Counter(z_coors.tolist()).most_common(1)[0]
+        return max_count / ports_coors.shape[0] >= tolerance
+
+    @staticmethod
+    def get_ports_coordinates(chain: nx.classes.reportviews.NodeView
+                              ) -> Tuple[np.ndarray, np.ndarray]:
+        """ Gets the port coordinates of a pipe strand as contiguous arrays.
+
+        Port positions are read only once per chain, all following checks
+        work on the returned arrays. Ports without position are left out,
+        pipes are only considered with exactly two positioned ports.
+
+        Args:
+            chain: A possible chain of elements to be an Underfloor heating.
+
+        Returns:
+            ports_coors: Array of shape (n, 3) with all port coordinates.
+            pipe_ports_coors: Array of shape (m, 2, 3) with the coordinates
+                of both ports of each pipe.
+        """
+        positions = []
+        pipe_positions = []
+        for element in chain:
+            element_positions = [getattr(port, 'position', None)
+                                 for port in element.ports]
+            positions.extend(position for position in element_positions
+                             if position is not None)
+            if type(element) is hvac.Pipe and len(element_positions) == 2 \
+                    and all(position is not None
+                            for position in element_positions):
+                pipe_positions.append(element_positions)
+        ports_coors = np.array(positions, dtype=np.float64).reshape(-1, 3)
+        pipe_ports_coors = np.array(
+            pipe_positions, dtype=np.float64).reshape(-1, 2, 3)
+        return ports_coors, pipe_ports_coors
 
     @staticmethod
     def get_pipe_strand_attributes(ports_coors: np.ndarray,
@@ -441,27 +557,33 @@ class UnderfloorHeating(PipeStrand):
             dist_x: Underfloor heating dimension in x.
             dist_y: Underfloor heating dimension in y.
         """
-        total_length = sum(segment.length for segment in chain if
-                           segment.length is not None)
-        avg_diameter = (sum(segment.diameter ** 2 * segment.length for segment
-                            in chain if segment.length is not
-                            None) / total_length) ** 0.5
-        length_unit = total_length.u
-        x_coord, y_coord = ports_coors[:, 0], ports_coors[:, 1]
-        min_x = ports_coors[np.argmin(x_coord)][:2]
-        max_x = ports_coors[np.argmax(x_coord)][:2]
-        min_y = ports_coors[np.argmin(y_coord)][:2]
-        max_y = ports_coors[np.argmax(y_coord)][:2]
+        segments = [(segment.length, segment.diameter) for segment in chain
+                    if segment.length is not None]
+        length_unit = segments[0][0].u
+        diameter_unit = segments[0][1].u
+        lengths = np.array([length.m_as(length_unit)
+                            for length, _ in segments])
+        diameters = np.array([diameter.m_as(diameter_unit)
+                              for _, diameter in segments])
+        length_sum = lengths.sum()
+        total_length = length_sum * length_unit
+        avg_diameter = (np.dot(diameters ** 2, lengths) / length_sum
+                        ) ** 0.5 * diameter_unit
+        # x-y extreme points, reduced column-wise in one call each
+        xy_coors = ports_coors[:, :2]
+        min_x, min_y = xy_coors[np.argmin(xy_coors, axis=0)]
+        max_x, max_y = xy_coors[np.argmax(xy_coors, axis=0)]
+        # plain float arithmetic, units are attached once on return
         if min_x[1] == max_x[1] or min_y[0] == max_y[0]:
-            dist_x = (max_x[0] - min_x[0]) * length_unit
-            dist_y = (max_y[1] - min_y[1]) * length_unit
-            heating_area = (dist_x * dist_y)
+            dist_x = max_x[0] - min_x[0]
+            dist_y = max_y[1] - min_y[1]
         else:
-            dist_x = (np.linalg.norm(min_y - max_x)) * length_unit
-            dist_y = (np.linalg.norm(min_y - min_x)) * length_unit
-            heating_area = (dist_x * dist_y)
+            dist_x = np.linalg.norm(min_y - max_x)
+            dist_y = np.linalg.norm(min_y - min_x)
+        heating_area = dist_x * dist_y * length_unit ** 2
 
-        return heating_area, total_length, avg_diameter, dist_x, dist_y
+        return heating_area, total_length, avg_diameter, \
+            dist_x * length_unit, dist_y * length_unit
 
     @staticmethod
     def get_ufh_type():
@@ -471,7 +593,7 @@ class UnderfloorHeating(PipeStrand):
 
     @classmethod
     def get_pipe_strand_spacing(cls,
-                                chain: nx.classes.reportviews.NodeView,
+                                pipe_ports_coors: np.ndarray,
                                 dist_x: ureg.Quantity,
                                 dist_y: ureg.Quantity,
                                 tolerance: int = 10
@@ -481,7 +603,8 @@ class UnderfloorHeating(PipeStrand):
             spacing.
 
         Args:
-            chain: possible chain of elements to be an Underfloor heating
+            pipe_ports_coors: array of shape (n, 2, 3) with the coordinates
+                of both ports of each pipe
             dist_x: Underfloor heating dimension in x
             dist_y: Underfloor heating dimension in y
             tolerance: integer tolerance to get pipe strand spacing
@@ -492,26 +615,20 @@ class UnderfloorHeating(PipeStrand):
         """
         # ToDo: what if multiple pipe elements on the same line? Collinear
         #  algorithm, issue #211
-        orientations = {}
-        for element in chain:
-            if type(element) is hvac.Pipe:
-                a = abs(element.ports[0].position[1] -
-                        element.ports[1].position[1])
-                b = abs(element.ports[0].position[0] -
-                        element.ports[1].position[0])
-                if b != 0:
-                    theta = int(math.degrees(math.atan(a / b)))
-                else:
-                    theta = 90
-                if theta not in orientations:
-                    orientations[theta] = []
-                orientations[theta].append(element)
-        for orient in orientations.copy():
-            if len(orientations[orient]) < tolerance:
-                del orientations[orient]
-        orientations = list(sorted(orientations.items()))
-        x_spacing = dist_x / (len(orientations[0][1]) - 1)
-        y_spacing = dist_y / (len(orientations[1][1]) - 1)
+        # x-y coordinates of both ports of all pipes, shape (n, 2, 2)
+        ports_coors = pipe_ports_coors[:, :, :2]
+        b, a = np.abs(ports_coors[:, 0] - ports_coors[:, 1]).T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thetas = np.where(
+                b != 0, np.degrees(np.arctan(a / b)), 90).astype(int)
+        # number of pipes per orientation, sorted by orientation
+        _, counts = np.unique(thetas, return_counts=True)
+        counts = counts[counts >= tolerance]
+        if len(counts) < 2 or counts[:2].min() < 2:
+            # no spacing without parallel pipes in two orientations
+            return 0 * dist_x, 0 * dist_y
+        x_spacing = dist_x / (int(counts[0]) - 1)
+        y_spacing = dist_y / (int(counts[1]) - 1)
         return x_spacing, y_spacing
 
     @staticmethod
@@ -548,8 +665,10 @@ class UnderfloorHeating(PipeStrand):
             None: if check fails
             True: if check succeeds
         """
-        if not ((tolerance[0] < x_spacing < tolerance[1])
-                or (tolerance[0] < y_spacing < tolerance[1])):
+        lower, upper = (limit.m_as(ureg.millimeter) for limit in tolerance)
+        x_spacing = x_spacing.m_as(ureg.millimeter)
+        y_spacing = y_spacing.m_as(ureg.millimeter)
+        if not ((lower < x_spacing < upper) or (lower < y_spacing < upper)):
             return
         return True
 
@@ -572,7 +691,9 @@ class UnderfloorHeating(PipeStrand):
             None: if check fails
             True: if check succeeds
         """
-        kpi_criteria = (total_length * avg_diameter) / heating_area
+        kpi_criteria = (total_length.m_as(ureg.meter)
+                        * avg_diameter.m_as(ureg.meter)
+                        / heating_area.m_as(ureg.meter ** 2))
         return tolerance[0] > kpi_criteria > tolerance[1]
 
     @classmethod
@@ -597,18 +718,19 @@ class UnderfloorHeating(PipeStrand):
         # TODO: use only floor heating pipes and not connecting pipes
         if not cls.check_number_of_elements(chain):
             return
-        ports_coordinates = np.array(
-            [p.position for e in chain for p in e.ports])
+        # one contiguous float64 block for all following numeric checks
+        ports_coordinates, pipe_ports_coordinates = \
+            cls.get_ports_coordinates(chain)
         if not cls.check_pipe_strand_horizontality(ports_coordinates):
             return
 
         heating_area, total_length, avg_diameter, dist_x, dist_y = \
             cls.get_pipe_strand_attributes(ports_coordinates, chain)
-        x_spacing, y_spacing = cls.get_pipe_strand_spacing(
-            chain, dist_x, dist_y)
-
         if not cls.check_heating_area(heating_area):
             return
+
+        x_spacing, y_spacing = cls.get_pipe_strand_spacing(
+            pipe_ports_coordinates, dist_x, dist_y)
         if not cls.check_spacing(x_spacing, y_spacing):
             return
         if not cls.check_kpi(total_length, avg_diameter, heating_area):
@@ -650,7 +772,8 @@ class UnderfloorHeating(PipeStrand):
 
 class ParallelPump(HVACAggregationMixin, hvac.Pump):
     """ Aggregates pumps in parallel."""
-    aggregatable_classes = {hvac.Pump, hvac.Pipe, hvac.PipeFitting, PipeStrand}
+    aggregatable_classes = frozenset(
+        {hvac.Pump, hvac.Pipe, hvac.PipeFitting, PipeStrand})
     whitelist_classe = {hvac.Pump}
 
     multi = ('rated_power', 'rated_height', 'rated_volume_flow', 'diameter',
@@ -688,23 +811,29 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
          elements."""
         avg_diameter_strand = 0
         total_length = 0
-        diameter_times_length = 0
+        segments = []
 
+        log_ignored = logger.isEnabledFor(logging.INFO)
         for item in self.not_pump_elements:
-            if hasattr(item, "diameter") and hasattr(item, "length"):
-                length = item.length
-                diameter = item.diameter
-                if not (length and diameter):
+            # a single lookup per attribute, missing attributes read as None
+            length = getattr(item, "length", None)
+            diameter = getattr(item, "diameter", None)
+            if not (length and diameter):
+                if log_ignored:
                     logger.info("Ignored '%s' in aggregation", item)
-                    continue
+                continue
 
-                diameter_times_length += length * diameter
-                total_length += length
-            else:
-                logger.info("Ignored '%s' in aggregation", item)
+            segments.append(
+                (length.m_as(ureg.meter), diameter.m_as(ureg.millimeter)))
 
-        if total_length != 0:
-            avg_diameter_strand = diameter_times_length / total_length
+        if segments:
+            # one (n, 2) block, reduced column-wise
+            lengths, diameters = np.array(segments, dtype=np.float64).T
+            length_sum = lengths.sum()
+            total_length = length_sum * ureg.meter
+            if length_sum != 0:
+                avg_diameter_strand = (np.dot(diameters, lengths) / length_sum
+                                       * ureg.millimeter)
 
         result = dict(
             length=total_length,
@@ -714,28 +843,30 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
 
     def get_replacement_mapping(self) \
             -> Dict[HVACPort, Union[HVACAggregationPort, None]]:
-        mapping = super().get_replacement_mapping()
-
         # TODO: cant this be solved in find_matches?
         # search for aggregations made during the parallel pump construction
-        new_aggregations = [element.aggregation for element in self.elements if
-                            element.aggregation is not self]
+        # while collecting the element ports, visit each aggregation once
+        mapping = {}
+        new_aggregations = {}
+        for element in self.elements:
+            for port in element.ports:
+                mapping[port] = None
+            if element.aggregation is not self:
+                new_aggregations[element.aggregation] = None
+        for port in self.ports:
+            for original in port.originals:
+                mapping[original] = port
         for port in (p for a in new_aggregations for p in a.ports):
             for original in port.originals:
                 mapping[original] = port
         return mapping
 
-
-    @cached_property
-    def pump_elements(self) -> list:
-        """list of pump-like elements present on the aggregation"""
-        return [ele for ele in self.elements if isinstance(ele, hvac.Pump)]
-
     def _calc_rated_power(self, name) -> ureg.Quantity:
         """Calculate the rated power adding the rated power of the pump-like
         elements"""
-        if all(ele.rated_power for ele in self.pump_elements):
-            return sum([ele.rated_power for ele in self.pump_elements])
+        rated_powers = [ele.rated_power for ele in self.pump_elements]
+        if all(rated_powers):
+            return sum(rated_powers)
         else:
             return None
 
@@ -749,7 +880,10 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
     def _calc_rated_height(self, name) -> ureg.Quantity:
         """Calculate the rated height, using the maximal rated height of
         the pump-like elements"""
-        return max([ele.rated_height for ele in self.pump_elements])
+        rated_heights = [ele.rated_height for ele in self.pump_elements]
+        if None in rated_heights:
+            return None
+        return max(rated_heights)
 
     rated_height = attribute.Attribute(
         description='rated height',
@@ -761,7 +895,12 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
     def _calc_volume_flow(self, name) -> ureg.Quantity:
         """Calculate the volume flow, adding the volume flow of the pump-like
         elements"""
-        return sum([ele.rated_volume_flow for ele in self.pump_elements])
+        rated_volume_flows = [ele.rated_volume_flow
+                              for ele in self.pump_elements]
+        if None in rated_volume_flows:
+            return None
+        unit = ureg.meter ** 3 / ureg.hour
+        return np.sum([flow.m_as(unit) for flow in rated_volume_flows]) * unit
 
     rated_volume_flow = attribute.Attribute(
         description='rated volume flow',
@@ -772,7 +911,12 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
 
     def _calc_diameter(self, name) -> ureg.Quantity:
         """Calculate the diameter, using the pump-like elements diameter"""
-        return sum(item.diameter ** 2 for item in self.pump_elements) ** 0.5
+        diameters = [item.diameter for item in self.pump_elements]
+        if None in diameters:
+            return None
+        diameters = np.array([diameter.m_as(ureg.millimeter)
+                              for diameter in diameters], dtype=np.float64)
+        return np.sqrt(np.dot(diameters, diameters)) * ureg.millimeter
 
     diameter = attribute.Attribute(
         description='diameter',
@@ -781,11 +925,6 @@ class ParallelPump(HVACAggregationMixin, hvac.Pump):
         dependant_instances='pump_elements'
     )
 
-    @cached_property
-    def not_pump_elements(self) -> list:
-        """list of not-pump-like elements present on the aggregation"""
-        return [ele for ele in self.elements if not isinstance(ele, hvac.Pump)]
-
     length = attribute.Attribute(
         description='length of aggregated pipe elements',
         functions=[_calc_avg],
@@ -822,10 +961,10 @@ class Consumer(HVACAggregationMixin, hvac.HVACProduct):
             border of a Consumer system.
     """
 
-    aggregatable_classes = {
+    aggregatable_classes = frozenset({
         hvac.SpaceHeater, hvac.Pipe, hvac.PipeFitting, hvac.Junction,
         hvac.Pump, hvac.Valve, hvac.ThreeWayValve, PipeStrand,
-        UnderfloorHeating}
+        UnderfloorHeating})
     whitelist_classes = {hvac.SpaceHeater, UnderfloorHeating}
     blacklist_classes = {hvac.Chiller, hvac.Boiler, hvac.CoolingTower,
                          hvac.HeatPump, hvac.Storage, hvac.CHP}
@@ -856,18 +995,20 @@ class Consumer(HVACAggregationMixin, hvac.HVACProduct):
         matches_graphs = []
         for cycle in cycles:
             cycle_graph = graph.subgraph(cycle)
+            # elements are collected from the port nodes on each access
+            cycle_elements = cycle_graph.elements
             # check for blacklist_classes in cycle, i.e. generators
-            generator = {ele for ele in cycle_graph.elements if
+            generator = {ele for ele in cycle_elements if
                          ele.__class__ in cls.blacklist_classes}
             if generator:
                 # check for whitelist_classes in cycle, i.e. consumers
-                gen_con = {ele for ele in cycle_graph.elements if
+                gen_con = {ele for ele in cycle_elements if
                            ele.__class__ in cls.whitelist_classes}
                 if gen_con:
                     # TODO: Consumer separieren
                     pass
             else:
-                consumer = {ele for ele in cycle_graph.elements if
+                consumer = {ele for ele in cycle_elements if
                             ele.__class__ in cls.whitelist_classes}
                 if consumer:
                     matches_graphs.append(cycle_graph)
@@ -875,25 +1016,9 @@ class Consumer(HVACAggregationMixin, hvac.HVACProduct):
         metas = [{} for x in matches_graphs]
         return matches_graphs, metas
 
-    @cached_property
-    def pump_elements(self) -> list:
-        """ List of pump-like elements present on the aggregation."""
-        return [ele for ele in self.elements if isinstance(ele, hvac.Pump)]
-
-    @cached_property
-    def not_pump_elements(self) -> list:
-        """ List of not-pump-like elements present on the aggregation."""
-        return [ele for ele in self.elements if not isinstance(ele, hvac.Pump)]
-
     def _calc_TControl(self, name):
         return any([isinstance(ele, hvac.ThreeWayValve) for ele in self.elements])
 
-    @cached_property
-    def whitelist_elements(self) -> list:
-        """ List of whitelist_classes elements present on the aggregation."""
-        return [ele for ele in self.elements
-                if type(ele) in self.whitelist_classes]
-
     def _calc_rated_power(self, name) -> ureg.Quantity:
         """ Calculate the rated power adding the rated power of the
             whitelist_classes elements.
@@ -1069,9 +1194,9 @@ class ConsumerHeatingDistributorModule(HVACAggregationMixin, hvac.HVACProduct):
         'medium', 'use_hydraulic_separator', 'hydraulic_separator_volume',
         'temperature_inlet', 'temperature_outlet')
     # TODO: Abused to not just sum attributes from elements
-    aggregatable_classes = {
+    aggregatable_classes = frozenset({
         hvac.SpaceHeater, hvac.Pipe, hvac.PipeFitting, hvac.Distributor,
-        PipeStrand, Consumer, hvac.Junction, hvac.ThreeWayValve }
+        PipeStrand, Consumer, hvac.Junction, hvac.ThreeWayValve})
     whitelist_classes = {
         hvac.SpaceHeater, UnderfloorHeating, Consumer}
     blacklist_classes = {hvac.Chiller, hvac.Boiler, hvac.CoolingTower}
@@ -1139,22 +1264,24 @@ class ConsumerHeatingDistributorModule(HVACAggregationMixin, hvac.HVACProduct):
             cycles = nx.connected_components(_graph)
             for cycle in cycles:
                 cycle_graph = base_graph.subgraph(cycle)
+                # elements are collected from the port nodes on each access
+                cycle_elements = cycle_graph.elements
                 # check for blacklist_classes in cycle, i.e. generators
-                generator = {ele for ele in cycle_graph.elements if
+                generator = {ele for ele in cycle_elements if
                              ele.__class__ in cls.blacklist_classes}
                 if generator:
                     # check for whitelist_classes in cycle that contains a
                     # generator
-                    gen_con = {ele for ele in cycle_graph.elements if
+                    gen_con = {ele for ele in cycle_elements if
                                ele.__class__ in cls.whitelist_classes}
                     if gen_con:
                         # TODO: separate consumer (maybe recursive function?)
                         pass
                 else:
-                    consumer_cycle = {ele for ele in cycle_graph.elements if
+                    consumer_cycle = {ele for ele in cycle_elements if
                                       ele.__class__ in cls.whitelist_classes}
                     if consumer_cycle:
-                        consumer_cycle_elements.extend(cycle_graph.elements)
+                        consumer_cycle_elements.extend(cycle_elements)
                         metas[-1]['consumer_cycles'].append(
                             consumer_cycle_elements)
                     else:
@@ -1186,11 +1313,6 @@ class ConsumerHeatingDistributorModule(HVACAggregationMixin, hvac.HVACProduct):
         functions=[_calc_avg]
     )
 
-    @cached_property
-    def whitelist_elements(self) -> list:
-        """list of whitelist_classes elements present on the aggregation"""
-        return [ele for ele in self.elements if type(ele) in self.whitelist_classes]
-
     def _calc_flow_temperature(self, name) -> list:
         """Calculate the flow temperature, using the flow temperature of the
         whitelist_classes elements"""
@@ -1313,6 +1435,23 @@ class ConsumerHeatingDistributorModule(HVACAggregationMixin, hvac.HVACProduct):
     )
 
 
+def _volume_weights(thermal_zones, name) -> list:
+    """Pairs of the thermal zones values of name and their net volume.
+
+    Each attribute is read once per zone, zones missing one of both are
+    skipped."""
+    weights = []
+    for tz in thermal_zones:
+        value = getattr(tz, name)
+        if value is None:
+            continue
+        net_volume = tz.net_volume
+        if net_volume is None:
+            continue
+        weights.append((value, net_volume))
+    return weights
+
+
 class AggregatedThermalZone(AggregationMixin, bps.ThermalZone):
     """Aggregates thermal zones"""
     aggregatable_elements = {bps.ThermalZone}
@@ -1327,12 +1466,10 @@ class AggregatedThermalZone(AggregationMixin, bps.ThermalZone):
 
     def bind_elements(self):
         """elements binder for the resultant thermal zone"""
-        bound_elements = []
-        for tz in self.elements:
-            for inst in tz.bound_elements:
-                if inst not in bound_elements:
-                    bound_elements.append(inst)
-        return bound_elements
+        # dict keys keep the order while skipping duplicates
+        bound_elements = dict.fromkeys(
+            inst for tz in self.elements for inst in tz.bound_elements)
+        return list(bound_elements)
 
     def bind_storeys(self):
         storeys = []
@@ -1390,8 +1527,9 @@ class AggregatedThermalZone(AggregationMixin, bps.ThermalZone):
 
     def _calc_net_volume(self, name) -> ureg.Quantity:
         """Calculate the thermal zone net volume"""
-        return sum(tz.net_volume for tz in self.elements if
-                   tz.net_volume is not None)
+        net_volumes = (tz.net_volume for tz in self.elements)
+        return sum(net_volume for net_volume in net_volumes
+                   if net_volume is not None)
 
     net_volume = attribute.Attribute(
         functions=[_calc_net_volume],
@@ -1407,8 +1545,8 @@ class AggregatedThermalZone(AggregationMixin, bps.ThermalZone):
         'ratio_conv_rad_machines', 'lighting_power', 'ratio_conv_rad_lighting', 'infiltration_rate',
         'max_user_infiltration', 'min_ahu', 'max_ahu', 'persons']"""
         prop_sum = sum(
-            getattr(tz, name) * tz.net_volume for tz in self.elements if
-            getattr(tz, name) is not None and tz.net_volume is not None)
+            value * net_volume
+            for value, net_volume in _volume_weights(self.elements, name))
         return prop_sum / self.net_volume
 
     def _intensive_list_calc(self, name) -> list:
@@ -1423,19 +1561,20 @@ class AggregatedThermalZone(AggregationMixin, bps.ThermalZone):
                       'max_summer_infiltration': 3,
                       'winter_reduction_infiltration': 3}
         length = list_attrs[name]
+        weights = _volume_weights(self.elements, name)
+        net_volume = self.net_volume
         aux = []
         for x in range(0, length):
-            aux.append(sum(
-                getattr(tz, name)[x] * tz.net_volume for tz in self.elements
-                if getattr(tz, name) is not None and tz.net_volume is not None)
-                       / self.net_volume)
+            aux.append(sum(values[x] * tz_net_volume
+                           for values, tz_net_volume in weights)
+                       / net_volume)
         return aux
 
     def _extensive_calc(self, name) -> ureg.Quantity:
         """extensive properties getter
         intensive_attributes = ['gross_area', 'net_area', 'volume']"""
-        return sum(getattr(tz, name) for tz in self.elements if
-                   getattr(tz, name) is not None)
+        values = (getattr(tz, name) for tz in self.elements)
+        return sum(value for value in values if value is not None)
 
     def _bool_calc(self, name) -> bool:
         """bool properties getter
@@ -1628,11 +1767,11 @@ class GeneratorOneFluid(HVACAggregationMixin, hvac.HVACProduct):
 
         Not for Chillers or Heat-pumps!
     """
-    aggregatable_classes = {
+    aggregatable_classes = frozenset({
         hvac.Pump, PipeStrand, hvac.Pipe, hvac.PipeFitting, hvac.Distributor,
         hvac.Boiler, ParallelPump, hvac.Valve, hvac.Storage,
         hvac.ThreeWayValve, hvac.Junction, ConsumerHeatingDistributorModule,
-        Consumer}
+        Consumer})
     whitelist_classes = {hvac.Boiler, hvac.CHP}
     boarder_classes = {hvac.Distributor, ConsumerHeatingDistributorModule}
     multi = ('rated_power', 'has_bypass', 'rated_height', 'volume',
@@ -1740,19 +1879,18 @@ class GeneratorOneFluid(HVACAggregationMixin, hvac.HVACProduct):
         total_length = 0
         diameter_times_length = 0
 
+        log_ignored = logger.isEnabledFor(logging.INFO)
         for element in self.not_whitelist_elements:
-            if hasattr(element, "diameter") and hasattr(element, "length"):
-                length = element.length
-                diameter = element.diameter
-                if not (length and diameter):
+            # a single lookup per attribute, missing attributes read as None
+            length = getattr(element, "length", None)
+            diameter = getattr(element, "diameter", None)
+            if not (length and diameter):
+                if log_ignored:
                     logger.info("Ignored '%s' in aggregation", element)
-                    continue
-
-                diameter_times_length += diameter * length
-                total_length += length
+                continue
 
-            else:
-                logger.info("Ignored '%s' in aggregation", element)
+            diameter_times_length += diameter * length
+            total_length += length
 
         if total_length != 0:
             avg_diameter_strand = diameter_times_length / total_length
@@ -1782,9 +1920,9 @@ class GeneratorOneFluid(HVACAggregationMixin, hvac.HVACProduct):
         Currently not used, might be removed in the future.
         """
         # todo remove if discussed
-        wanted = set(cls.whitelist_classes)
-        boarders = set(cls.boarder_classes)
-        inerts = set(cls.aggregatable_elements) - wanted
+        wanted = cls.whitelist_classes
+        boarders = cls.boarder_classes
+        inerts = cls.aggregatable_classes - wanted
         bypass_nodes = HvacGraph.detect_bypasses_to_wanted(
             graph, wanted, inerts, boarders)
         return bypass_nodes
@@ -1809,12 +1947,6 @@ class GeneratorOneFluid(HVACAggregationMixin, hvac.HVACProduct):
         self.has_bypass = has_bypass
         return has_bypass
 
-    @cached_property
-    def whitelist_elements(self) -> list:
-        """ List of whitelist_classes elements present on the aggregation"""
-        return [ele for ele in self.elements if type(ele)
-                in self.whitelist_classes]
-
     @cached_property
     def not_whitelist_elements(self) -> list:
         """ List of not-whitelist_classes elements present on the aggregation"""
@@ -1923,16 +2055,12 @@ class GeneratorOneFluid(HVACAggregationMixin, hvac.HVACProduct):
         functions=[HVACAggregationMixin._calc_has_pump]
     )
 
-    @cached_property
-    def pump_elements(self) -> list:
-        """ List of pump-like elements present on the aggregation"""
-        return [ele for ele in self.elements if isinstance(ele, hvac.Pump)]
-
     def _calc_rated_pump_power(self, name) -> ureg.Quantity:
         """ Calculate the rated pump power adding the rated power of the
             pump-like elements."""
-        if all(ele.rated_power for ele in self.pump_elements):
-            return sum([ele.rated_power for ele in self.pump_elements])
+        rated_powers = [ele.rated_power for ele in self.pump_elements]
+        if all(rated_powers):
+            return sum(rated_powers)
         else:
             return None
 
@@ -490,6 +490,9 @@ class AttributeManager(dict):
         value: tuple with (value of attribute, Status of attribute).
     """
 
+    # attribute names per element class, see names
+    _names_cache = {}
+
     def __init__(self, bind):
         super().__init__()
         self.bind = bind
@@ -562,10 +565,15 @@ class AttributeManager(dict):
 
     @property
     def names(self):
-        """Returns a generator object with all attributes that the corresponding
-        bind owns."""
-        return (name for name in dir(type(self.bind))
-                if isinstance(getattr(type(self.bind), name), Attribute))
+        """Returns a tuple with all attributes that the corresponding bind
+        owns. The names are collected once per class."""
+        cls = type(self.bind)
+        names = self._names_cache.get(cls)
+        if names is None:
+            names = tuple(name for name in dir(cls)
+                          if isinstance(getattr(cls, name), Attribute))
+            self._names_cache[cls] = names
+        return names
 
     def get_decisions(self) -> DecisionBunch:
         """Return all decision of attributes with status REQUESTED."""
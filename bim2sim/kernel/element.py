@@ -275,6 +275,7 @@ class IFCBased(Element):
         self.enrichment = {}  # TODO: DJA
         self._propertysets = None
         self._type_propertysets = None
+        self._propertysets_by_name = {}
         self._decision_results = {}
 
     @classmethod
@@ -363,8 +364,14 @@ class IFCBased(Element):
         return getattr(self.ifc, attribute, None)
 
     def get_propertyset(self, propertysetname):
-        return ifc2python.get_property_set_by_name(
-            propertysetname, self.ifc, self.ifc_units)
+        """Get PropertySet by name, each name is searched only once."""
+        try:
+            return self._propertysets_by_name[propertysetname]
+        except KeyError:
+            property_set = ifc2python.get_property_set_by_name(
+                propertysetname, self.ifc, self.ifc_units)
+            self._propertysets_by_name[propertysetname] = property_set
+            return property_set
 
     def get_propertysets(self):
         if self._propertysets is None:
@@ -467,11 +474,12 @@ class IFCBased(Element):
             # return hits[0][0]
         if optional_locations:
             for loc in optional_locations:
-                hits = [p.search(ifc2python.get_property_set_by_name(
-                    loc, ifc_element, ifc_units) or '')
-                        for p in cls.pattern_ifc_type
-                        if ifc2python.get_property_set_by_name(
-                        loc, ifc_element, ifc_units)]
+                # look up the location once instead of twice per pattern
+                text = ifc2python.get_property_set_by_name(
+                    loc, ifc_element, ifc_units)
+                if not text:
+                    continue
+                hits = [p.search(text) for p in cls.pattern_ifc_type]
                 hits = [x for x in hits if x is not None]
                 if any(hits):
                     quality_logger.info("Identified %s through text fracments in %s. Criteria: %s", cls.ifc_type, loc, hits)
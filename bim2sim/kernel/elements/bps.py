@@ -64,7 +64,7 @@ class BPSProduct(element.ProductBased):
         """get the top_bottom function, determines if a horizontal element
         normal points up (bottom) or points down (top)"""
         return list(
-            set([sb.top_bottom for sb in self.sbs_without_corresponding]))
+            {sb.top_bottom for sb in self.sbs_without_corresponding})
 
     @cached_property
     def is_external(self) -> bool or None:
@@ -76,8 +76,8 @@ class BPSProduct(element.ProductBased):
             if hasattr(self.ifc, 'ProvidesBoundaries'):
                 if len(self.ifc.ProvidesBoundaries) > 0:
                     ext_int = list(
-                        set([boundary.InternalOrExternalBoundary for boundary
-                             in self.ifc.ProvidesBoundaries]))
+                        {boundary.InternalOrExternalBoundary for boundary
+                         in self.ifc.ProvidesBoundaries})
                     if len(ext_int) == 1:
                         if ext_int[0].lower() == 'external':
                             return True
@@ -103,13 +103,14 @@ class BPSProduct(element.ProductBased):
     @cached_property
     def sbs_without_corresponding(self):
         """get a list with only not duplicated space boundaries"""
-        sbs_without_corresponding = list(self.space_boundaries)
+        # dict keys keep the order and allow constant time removal
+        sbs_without_corresponding = dict.fromkeys(self.space_boundaries)
         for sb in self.space_boundaries:
             if sb in sbs_without_corresponding:
                 if sb.related_bound and sb.related_bound in \
                         sbs_without_corresponding:
-                    sbs_without_corresponding.remove(sb.related_bound)
-        return sbs_without_corresponding
+                    del sbs_without_corresponding[sb.related_bound]
+        return list(sbs_without_corresponding)
 
     top_bottom = attribute.Attribute(
         functions=[get_top_bottom],
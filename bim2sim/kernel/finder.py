@@ -15,8 +15,7 @@ from ifcopenshell import file, entity_instance
 
 import bim2sim
 from bim2sim.decision import ListDecision, Decision, DecisionBunch
-from bim2sim.kernel import ifc2python
-from bim2sim.utilities.common_functions import validateJSON
+from bim2sim.utilities.common_functions import load_json
 
 if TYPE_CHECKING:
     from bim2sim.kernel.element import IFCBased
@@ -52,6 +51,8 @@ class TemplateFinder(Finder):
         super().__init__()
         # {tool: {Element class name: {parameter: (Pset name, property name)}}}
         self.templates = {}
+        # {(tool, Element class name, parameter): (Pset name, property name)}
+        self._lookup = None
         self.blacklist = []
         self.path = None
         self.load(DEFAULT_PATH)  # load default path
@@ -73,17 +74,15 @@ class TemplateFinder(Finder):
         if not isinstance(path, Path):
             path = Path(path)
         self.path = path
+        self._lookup = None
 
         # search in path
         json_gen = self.path.rglob('*.json')
         for json_file_path in json_gen:
             if json_file_path.name.lower().startswith(TemplateFinder.prefix):
                 tool_name = json_file_path.stem[len(TemplateFinder.prefix):]
-                if validateJSON(json_file_path):
-                    with open(json_file_path, 'rb') as json_file:
-                        self.templates[tool_name] = json.load(json_file)
-                else:
-                    raise ValueError(f"Invalid JSON in {json_file_path}")
+                # parsed once, the raw content is cached by path and mtime
+                self.templates[tool_name] = load_json(json_file_path)
 
     def save(self, path):
         """Save templates to path, one file for each tool in templates.
@@ -97,8 +96,10 @@ class TemplateFinder(Finder):
         for tool, element_dict in self.templates.items():
             full_path = os.path.join(
                 path, TemplateFinder.prefix + tool + '.json')
+            # encode at once, json.dump writes each encoded chunk separately
+            content = json.dumps(element_dict, indent=2)
             with open(full_path, 'w') as file:
-                json.dump(element_dict, file, indent=2)
+                file.write(content)
 
     def set(
             self, tool, ifc_type: str, parameter, property_set_name,
@@ -109,6 +110,17 @@ class TemplateFinder(Finder):
         value = [property_set_name, property_name]
         self.templates.setdefault(tool, {}).setdefault(ifc_type, {}).setdefault(
             'default_ps', {})[parameter] = value
+        self._lookup = None
+
+    def _build_lookup(self) -> dict:
+        """Flatten templates to a dict with (tool, type, parameter) keys."""
+        return {
+            (tool, ifc_type, parameter): value
+            for tool, element_dict in self.templates.items()
+            for ifc_type, type_dict in element_dict.items()
+            if isinstance(type_dict, dict)
+            for parameter, value in type_dict.get('default_ps', {}).items()
+        }
 
     def find(self, element: IFCBased, property_name: str):
         """Tries to find the required property.
@@ -128,27 +140,25 @@ class TemplateFinder(Finder):
         self._get_elements_source_tool(element)
         if not element.source_tool:
             return None
+        if self._lookup is None:
+            self._lookup = self._build_lookup()
         key1 = element.source_tool.templ_name
         key2 = type(element).__name__
-        key3 = 'default_ps'
-        key4 = property_name
-        try:
-            res = self.templates[key1][key2][key3][key4]
-        except KeyError:
+        res = self._lookup.get((key1, key2, property_name))
+        if res is None:
             raise AttributeError("%s does not know where to look for %s" % (
-                self.__class__.__name__, (key1, key2, key3, key4)))
+                self.__class__.__name__,
+                (key1, key2, 'default_ps', property_name)))
 
         try:
             if all([isinstance(res[0], list), isinstance(res[1], list)]):
                 for res_ele in res:
-                    pset = ifc2python.get_property_set_by_name(
-                        res_ele[0], element.ifc, element.ifc_units)
+                    pset = element.get_propertyset(res_ele[0])
                     if pset:
                         res = res_ele
                         break
             else:
-                pset = ifc2python.get_property_set_by_name(
-                    res[0], element.ifc, element.ifc_units)
+                pset = element.get_propertyset(res[0])
             return pset.get(res[1])
         except AttributeError:
             raise AttributeError("Can't find property as defined by template.")
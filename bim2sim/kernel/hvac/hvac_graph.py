@@ -65,8 +65,10 @@ class HvacGraph(nx.Graph):
         """View of graph with elements instead of ports"""
         graph = nx.Graph()
         nodes = {ele.parent for ele in self.nodes if ele}
-        edges = {(con[0].parent, con[1].parent) for con in self.edges
-                 if not con[0].parent is con[1].parent}
+        # look up the parents of each connection only once
+        parent_edges = ((port_a.parent, port_b.parent)
+                        for port_a, port_b in self.edges)
+        edges = {edge for edge in parent_edges if edge[0] is not edge[1]}
         graph.update(nodes=nodes, edges=edges)
         return graph
 
@@ -139,8 +141,15 @@ class HvacGraph(nx.Graph):
         # order elements as connected
 
         for component in nx.connected_components(subgraph_aggregations):
-            subgraph = subgraph_aggregations.subgraph(component).copy()
-            end_nodes = [v for v, d in subgraph.degree() if d == 1]
+            # read only view, the component is not modified
+            subgraph = subgraph_aggregations.subgraph(component)
+            end_nodes = []
+            for v, d in subgraph.degree():
+                if d == 1:
+                    end_nodes.append(v)
+                    if len(end_nodes) > 2:
+                        # no chain, further end nodes are not needed
+                        break
 
             if len(end_nodes) != 2:
                 if include_singles:
@@ -168,8 +177,13 @@ class HvacGraph(nx.Graph):
         or None as values
         :param inner_connections: connections to add"""
 
-        replace = {k: v for k, v in mapping.items() if not v is None}
-        remove = [k for k, v in mapping.items() if v is None]
+        replace = {}
+        remove = []
+        for port, new_port in mapping.items():
+            if new_port is None:
+                remove.append(port)
+            else:
+                replace[port] = new_port
 
         nx.relabel_nodes(self, replace, copy=False)
         self.remove_nodes_from(remove)
@@ -291,10 +305,9 @@ class HvacGraph(nx.Graph):
 
             net.from_nx(graph, default_node_size=50)
             for node in net.nodes:
-                try:
-                    node['label'] = node['label'].split('<')[1]
-                except:
-                    pass
+                label_parts = node['label'].split('<')
+                if len(label_parts) > 1:
+                    node['label'] = label_parts[1]
                 node['label'] = node['label'].split('(ports')[0]
                 if 'agg' in node['label'].lower():
                     node['label'] = node['label'].split('Agg0')[0]
@@ -559,12 +572,12 @@ class HvacGraph(nx.Graph):
                 for item in wanteds:
                     occurrence_cycles.setdefault(item, []).append(cycle)
 
-        # detect connected cycles
+        # detect connected cycles, known is an insertion ordered set
         def related_cycles(item, known):
             sub_cycles = occurrence_cycles[item]
             for cycle in sub_cycles:
                 if cycle not in known:
-                    known.append(cycle)
+                    known[cycle] = None
                     sub_items = cycle_occurrences[cycle]
                     for sub_item in sub_items:
                         related_cycles(sub_item, known)
@@ -573,9 +586,9 @@ class HvacGraph(nx.Graph):
         known_items = set()
         for item in occurrence_cycles:
             if item not in known_items:
-                known = []
+                known = {}
                 related_cycles(item, known)
-                cycle_sets.append(known)
+                cycle_sets.append(list(known))
                 known_items = known_items | {
                     oc for k in known for oc in cycle_occurrences[k]}
 
@@ -53,7 +53,8 @@ def default_logging_setup(verbose=False):
         stream_handler.addFilter(log_filter)
         general_logger.addHandler(stream_handler)
 
-    file_handler = logging.FileHandler("bim2sim.log")
+    # the log file is only opened (and created) on the first emitted record
+    file_handler = logging.FileHandler("bim2sim.log", delay=True)
     file_handler.setFormatter(dev_formatter)
     file_handler.addFilter(log_filter)
     general_logger.addHandler(file_handler)
@@ -71,12 +71,14 @@ class Pump(AixLib):
             self.check_numeric(min_value=0 * ureg['newton/m**2']))
         # generic pump operation curve
         # todo renders as "V_flow" only in Modelica
+        rated_mass_flow = self.element.rated_mass_flow
+        rated_pressure_difference = self.element.rated_pressure_difference
         self.params["per.pressure"] =\
             f"V_flow={{0," \
-            f" {self.element.rated_mass_flow}/1000," \
-            f" {self.element.rated_mass_flow} /1000/0.7}}," \
-            f" dp={{ {self.element.rated_pressure_difference} / 0.7," \
-            f" {self.element.rated_pressure_difference}," \
+            f" {rated_mass_flow}/1000," \
+            f" {rated_mass_flow} /1000/0.7}}," \
+            f" dp={{ {rated_pressure_difference} / 0.7," \
+            f" {rated_pressure_difference}," \
             f"0}}"
 
         # ToDo remove decisions from tests if not asking this anymore
@@ -9,8 +9,10 @@ import logging
 
 import ifcopenshell
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.BRepBndLib import brepbndlib_Add
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeVertex
 from OCC.Core.BRepExtrema import BRepExtrema_DistShapeShape
+from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.Extrema import Extrema_ExtFlag_MIN
 from OCC.Core.TopoDS import TopoDS_Face
 from OCC.Core.gp import gp_Pnt
@@ -25,6 +27,11 @@ from bim2sim.plugins.PluginEnergyPlus.bim2sim_energyplus.task \
     import EPGeomPreprocessing
 
 logger = logging.getLogger(__name__)
+settings = ifcopenshell.geom.main.settings()
+settings.set(settings.USE_PYTHON_OPENCASCADE, True)
+settings.set(settings.USE_WORLD_COORDS, True)
+settings.set(settings.EXCLUDE_SOLIDS_AND_SURFACES, False)
+settings.set(settings.INCLUDE_CURVES, True)
 
 
 class AddSpaceBoundaries2B(ITask):
@@ -65,6 +72,8 @@ class AddSpaceBoundaries2B(ITask):
         """
         logger.info("Generate space boundaries of type 2B")
         inst_2b = dict()
+        # shapes of the bounded instances, shared by all spaces
+        shapes = dict()
         spaces = get_spaces_with_bounds(instances)
         for space_obj in spaces:
             # compare surface area of IfcSpace shape with sum of space
@@ -79,10 +88,18 @@ class AddSpaceBoundaries2B(ITask):
                 continue
             # spaces which reach this point have gaps in their boundaries.
             space_obj.b_bound_shape = space_obj.space_shape
+            # the leftover shape stays within the bounding box of the space
+            space_box = self.get_bounding_box(space_obj.space_shape, 1e-6)
+            # area of the leftover shape, only changes when a bound is cut
+            b_bound_area = space_surf_area
             for bound in space_obj.space_boundaries:
+                if b_bound_area == 0:
+                    # nothing left to cut from
+                    break
                 if bound.bound_area.m == 0:
                     continue
-                if PyOCCTools.get_shape_area(space_obj.b_bound_shape) == 0:
+                # cheap prefilter before the exact distance computation
+                if space_box.IsOut(self.get_bounding_box(bound.bound_shape)):
                     continue
                 # exclude surfaces that are too far from space shape.
                 distance = BRepExtrema_DistShapeShape(
@@ -94,16 +111,37 @@ class AddSpaceBoundaries2B(ITask):
                 # cut the current shape from the (leftover) space shape.
                 space_obj.b_bound_shape = BRepAlgoAPI_Cut(
                     space_obj.b_bound_shape, bound.bound_shape).Shape()
+                b_bound_area = PyOCCTools.get_shape_area(
+                    space_obj.b_bound_shape)
             # extract faces from the leftover shape.
             faces = PyOCCTools.get_faces_from_shape(space_obj.b_bound_shape)
             if faces:
                 # create a new 2b space boundary for each face..
-                inst_2b.update(self.create_2b_space_boundaries(faces, space_obj))
+                inst_2b.update(self.create_2b_space_boundaries(
+                    faces, space_obj, shapes))
         return inst_2b
 
     @staticmethod
-    def create_2b_space_boundaries(faces: list[TopoDS_Face],
-                                   space_obj: ThermalZone)\
+    def get_bounding_box(shape, tolerance: float = 0) -> Bnd_Box:
+        """Get the axis aligned bounding box of a shape.
+
+        Args:
+            shape: TopoDS_Shape
+            tolerance: gap the bounding box is enlarged by
+
+        Returns:
+            Bnd_Box
+        """
+        bbox = Bnd_Box()
+        brepbndlib_Add(shape, bbox)
+        if tolerance:
+            bbox.Enlarge(tolerance)
+        return bbox
+
+    @classmethod
+    def create_2b_space_boundaries(cls, faces: list[TopoDS_Face],
+                                   space_obj: ThermalZone,
+                                   shapes: dict = None)\
             -> dict[str: SpaceBoundary2B]:
         """Create new 2b space boundaries.
 
@@ -113,19 +151,19 @@ class AddSpaceBoundaries2B(ITask):
         Args:
             faces: list of TopoDS_Face
             space_obj: ThermalZone instance
+            shapes: dict[GlobalId: TopoDS_Shape] of already created shapes
+                of bounded instances, extended by this method
 
         Returns:
             dict[guid: SpaceBoundary2B]
 
         """
-        settings = ifcopenshell.geom.main.settings()
-        settings.set(settings.USE_PYTHON_OPENCASCADE, True)
-        settings.set(settings.USE_WORLD_COORDS, True)
-        settings.set(settings.EXCLUDE_SOLIDS_AND_SURFACES, False)
-        settings.set(settings.INCLUDE_CURVES, True)
+        if shapes is None:
+            shapes = dict()
         inst_2b = dict()
         space_obj.space_boundaries_2B = []
-        bound_obj = []
+        # dict as insertion ordered set, instances may bound several times
+        bound_obj = dict()
 
         # generate a list of IFCBased instances (e.g. Wall) that are the
         # space surrounding elements. Initialize a shape (geometry) for these
@@ -133,9 +171,16 @@ class AddSpaceBoundaries2B(ITask):
         for bound in space_obj.space_boundaries:
             if bound.bound_instance and bound.bound_instance.ifc.Representation:
                 bi = bound.bound_instance.ifc
-                bound.bound_instance.shape = ifcopenshell.geom.create_shape(
-                    settings, bi).geometry
-                bound_obj.append(bound.bound_instance)
+                shape = shapes.get(bi.GlobalId)
+                if shape is None:
+                    shape = ifcopenshell.geom.create_shape(
+                        settings, bi).geometry
+                    shapes[bi.GlobalId] = shape
+                bound.bound_instance.shape = shape
+                bound_obj[bound.bound_instance] = None
+        boxes = {instance: cls.get_bounding_box(instance.shape, 1e-3)
+                 for instance in bound_obj
+                 if not isinstance(instance, (Door, Window))}
 
         for i, face in enumerate(faces):
             b_bound = SpaceBoundary2B()
@@ -145,11 +190,14 @@ class AddSpaceBoundaries2B(ITask):
             b_bound.guid = ifcopenshell.guid.new()
             b_bound.bound_thermal_zone = space_obj
             # get the building element that is bounded by the current 2b bound
+            center = gp_Pnt(b_bound.bound_center)
+            center_shape = BRepBuilderAPI_MakeVertex(center).Shape()
             for instance in bound_obj:
                 if isinstance(instance, Door) or isinstance(instance, Window):
                     continue
-                center_shape = BRepBuilderAPI_MakeVertex(
-                    gp_Pnt(b_bound.bound_center)).Shape()
+                # cheap prefilter before the exact distance computation
+                if boxes[instance].IsOut(center):
+                    continue
                 distance = BRepExtrema_DistShapeShape(
                     center_shape, instance.shape, Extrema_ExtFlag_MIN).Value()
                 if distance < 1e-3:
@@ -12,6 +12,7 @@ import os
 from pathlib import Path, PosixPath
 from typing import Union
 
+import numpy as np
 from OCC.Core.BRep import BRep_Tool
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
 from OCC.Core.BRepTools import breptools_UVBounds, BRepTools_WireExplorer
@@ -794,8 +795,7 @@ class CreateIdf(ITask):
         if not spatials:
             return
         pure_spatials = []
-        description_list = [s.ifc.Description for s in spatials]
-        descriptions = list(dict.fromkeys(description_list))
+        descriptions = {s.ifc.Description for s in spatials}
         shades_included = ("Shading:Building" or "Shading:Site") in descriptions
 
         # check if ifc has dedicated shading space boundaries included and
@@ -1447,18 +1447,14 @@ class IdfObject:
         circular_shape = False
         # compute if shape is circular:
         if len(obj_pnts) > 4:
-            pnt = obj_pnts[0]
-            pnt2 = obj_pnts[1]
-            distance_prev = pnt.Distance(pnt2)
-            pnt = pnt2
-            for pnt2 in obj_pnts[2:]:
-                distance = pnt.Distance(pnt2)
-                if (distance_prev - distance) ** 2 < 0.01:
-                    circular_shape = True
-                    pnt = pnt2
-                    distance_prev = distance
-                else:
-                    continue
+            # the shape is circular as soon as one vertex has about the same
+            # distance to the second vertex as the first one, so all
+            # distances are compared at once
+            coords = np.array([pnt.Coord() for pnt in obj_pnts])
+            distance_prev = np.linalg.norm(coords[1] - coords[0])
+            distances = np.linalg.norm(coords[2:] - coords[1], axis=1)
+            circular_shape = bool(
+                np.any((distance_prev - distances) ** 2 < 0.01))
         return circular_shape
 
     @staticmethod
@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pandas as pd
 
 from bim2sim.task.base import ITask
@@ -108,12 +110,12 @@ class IdfPostprocessing(ITask):
                      "IDF_all", "IDF_all_B", "IDF_ADB", "IDF_SFB", "IDF_ODB", "IDF_GDB", "IDF_VTB", "IDF_all_F",
                      "IDF_ODF", "IDF_INF"])
         ifc_bounds = ifc.by_type('IfcRelSpaceBoundary')
-        bounds_2b = [instances[inst] for inst in instances if instances[inst].__class__.__name__ == "SpaceBoundary2B"]
+        bounds_2b = [inst for inst in instances.values()
+                     if type(inst).__name__ == "SpaceBoundary2B"]
         idf_all_b = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"]]
-        idf_adb = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"] if s.Outside_Boundary_Condition == "Adiabatic"]
-        idf_sfb = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"] if s.Outside_Boundary_Condition == "Surface"]
-        idf_odb = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"] if s.Outside_Boundary_Condition == "Outdoors"]
-        idf_gdb = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"] if s.Outside_Boundary_Condition == "Ground"]
+        # count all outside boundary conditions in a single pass
+        boundary_conditions = Counter(
+            s.Outside_Boundary_Condition for s in idf_all_b)
         idf_vtb = [s for s in idf.idfobjects["BUILDINGSURFACE:DETAILED"] if s.Construction_Name == "Air Wall"]
         idf_all_f = [f for f in idf.idfobjects["FENESTRATIONSURFACE:DETAILED"]]
         idf_odf = [f for f in idf.idfobjects["FENESTRATIONSURFACE:DETAILED"] if
@@ -128,10 +130,10 @@ class IdfPostprocessing(ITask):
             "BIM2SIM_SB_2b": len(bounds_2b),
             "IDF_all": len(idf_all_b) + len(idf_all_f),
             "IDF_all_B": len(idf_all_b),
-            "IDF_ADB": len(idf_adb),
-            "IDF_SFB": len(idf_sfb),
-            "IDF_ODB": len(idf_odb),
-            "IDF_GDB": len(idf_gdb),
+            "IDF_ADB": boundary_conditions["Adiabatic"],
+            "IDF_SFB": boundary_conditions["Surface"],
+            "IDF_ODB": boundary_conditions["Outdoors"],
+            "IDF_GDB": boundary_conditions["Ground"],
             "IDF_VTB": len(idf_vtb),
             "IDF_all_F": len(idf_all_f),
             "IDF_ODF": len(idf_odf),
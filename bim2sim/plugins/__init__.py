@@ -6,13 +6,16 @@ import sys
 from abc import ABCMeta
 from inspect import isclass
 from pathlib import Path
-from typing import Set, Type, List
+from typing import Dict, Set, Tuple, Type, List
 
 from bim2sim.task.base import ITask
 from bim2sim.workflow import Workflow
 
 logger = logging.getLogger(__name__)
 
+# cache for plugin discovery results, keyed by sys.path
+_available_plugins_cache: Dict[Tuple[str, ...], List[str]] = {}
+
 
 def add_plugins_to_path(root: Path):
     """Add all directories under root to path."""
@@ -52,12 +55,25 @@ class Plugin:
 
 
 def available_plugins() -> List[str]:
-    """List all available plugins."""
-    plugins = []
-    for finder, name, is_pkg in pkgutil.iter_modules():
-        if is_pkg and name.startswith('bim2sim_'):
-            plugins.append(name)
-    return plugins
+    """List all available plugins.
+
+    Scanning sys.path is expensive, so results are cached per sys.path. Use
+    clear_plugin_cache() to force a rescan.
+    """
+    key = tuple(sys.path)
+    plugins = _available_plugins_cache.get(key)
+    if plugins is None:
+        plugins = []
+        for finder, name, is_pkg in pkgutil.iter_modules():
+            if is_pkg and name.startswith('bim2sim_'):
+                plugins.append(name)
+        _available_plugins_cache[key] = plugins
+    return list(plugins)
+
+
+def clear_plugin_cache():
+    """Clear cached results of available_plugins()."""
+    _available_plugins_cache.clear()
 
 
 def load_plugin(name: str) -> Type[Plugin]:
@@ -12,8 +12,6 @@ import pkgutil
 import re
 from typing import Dict, List, Type, Union
 
-import pkg_resources
-
 import configparser
 
 from bim2sim.decision import Decision, ListDecision, DecisionBunch, save, load
@@ -397,8 +395,9 @@ class Project:
 
         # quality logger
         quality_logger = logging.getLogger('bim2sim.QualityReport')
+        # delay opening the file until the first record is emitted
         quality_handler = logging.FileHandler(
-            os.path.join(self.paths.log, "IFCQualityReport.log"))
+            os.path.join(self.paths.log, "IFCQualityReport.log"), delay=True)
         quality_handler.addFilter(log.ThreadLogFilter(thread_name))
         quality_handler.setFormatter(log.quality_formatter)
         quality_logger.addHandler(quality_handler)
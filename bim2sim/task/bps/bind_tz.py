@@ -197,15 +197,10 @@ class BindThermalZones(ITask):
     @classmethod
     def group_by_is_neighbor(cls, thermal_zones: list) -> dict:
         """groups together the thermal zones based on is_neighbor criterion"""
-        grouped_tz = {'': list(thermal_zones)}
-        for tz in thermal_zones:
-            neighbor_statement = False
-            for neighbor in tz.space_neighbors:
-                if neighbor in thermal_zones:
-                    neighbor_statement = True
-                    break
-            if not neighbor_statement:
-                grouped_tz[''].remove(tz)
+        zones = set(thermal_zones)
+        grouped_tz = {'': [
+            tz for tz in thermal_zones
+            if any(neighbor in zones for neighbor in tz.space_neighbors)]}
         cls.discard_1_element_groups(grouped_tz)
         return grouped_tz
 
@@ -16,13 +16,18 @@ class DisaggregationCreation(ITask):
     # not necessary
     reads = ('instances',)
     touches = ('disaggregations',)
+    # attributes that are set explicitly and not taken from the parent
+    attributes_blacklist = frozenset(
+        {'position', 'net_area', 'gross_area', 'opening_area'})
 
     def __init__(self):
         super().__init__()
         self.disaggregations = {}
-        self.vertical_instances = ['Wall', 'InnerWall', 'OuterWall']
-        self.horizontal_instances = ['Roof', 'Floor', 'GroundFloor']
+        self.vertical_instances = {'Wall', 'InnerWall', 'OuterWall'}
+        self.horizontal_instances = {'Roof', 'Floor', 'GroundFloor'}
         self.attributes_dict = {}
+        # {instance: (space boundaries set, thermal zones set)}
+        self.known_relations = {}
 
     def run(self, workflow, instances):
         thermal_zones = filter_instances(instances, 'ThermalZone')
@@ -37,7 +42,8 @@ class DisaggregationCreation(ITask):
         return self.disaggregations,
 
     def get_thermal_zone_disaggregations(self, tz):
-        tz_disaggregations = []
+        # dict as insertion ordered set of disaggregations
+        tz_disaggregations = {}
         for sb in tz.space_boundaries:
             bound_instance = sb.bound_instance
             if bound_instance is not None:
@@ -60,14 +66,25 @@ class DisaggregationCreation(ITask):
                                 self.disaggregations[sb.related_bound.guid] = \
                                     inst
                 if inst:
-                    if inst not in tz_disaggregations:
-                        tz_disaggregations.append(inst)
-                    if sb not in inst.space_boundaries:
+                    tz_disaggregations[inst] = None
+                    known_sbs, known_tzs = self.get_known_relations(inst)
+                    if sb not in known_sbs:
+                        known_sbs.add(sb)
                         inst.space_boundaries.append(sb)
-                    if tz not in inst.thermal_zones:
+                    if tz not in known_tzs:
+                        known_tzs.add(tz)
                         inst.thermal_zones.append(tz)
 
-        return tz_disaggregations
+        return list(tz_disaggregations)
+
+    def get_known_relations(self, inst):
+        """get sets of the space boundaries and thermal zones of instance,
+        which are kept in sync with the lists while this task runs"""
+        known = self.known_relations.get(inst)
+        if known is None:
+            known = (set(inst.space_boundaries), set(inst.thermal_zones))
+            self.known_relations[inst] = known
+        return known
 
     def create_disaggregation(self, bound_instance, sb, tz):
         """# todo write documentation"""
@@ -116,9 +133,8 @@ class DisaggregationCreation(ITask):
             inst.position = tz.position
             if tz.net_area and abs(1 - inst.net_area / tz.net_area) < threshold:
                 inst.net_area = tz.net_area
-        blacklist = ['position', 'net_area', 'gross_area', 'opening_area']
         for prop in self.attributes_dict[type_parent]:
-            if prop not in blacklist:
+            if prop not in self.attributes_blacklist:
                 dis_value = getattr(inst, prop)
                 if dis_value is None or dis_value == []:
                     parent_value = getattr(inst.parent, prop)
@@ -136,8 +152,9 @@ class DisaggregationCreation(ITask):
                 < 315:
             y1, z1, z1 = sub_position
 
-        x = x - x1 * math.cos(math.radians(rel_orientation_wall))
-        y = y - y1 * math.sin(math.radians(rel_orientation_wall))
+        rel_orientation_rad = math.radians(rel_orientation_wall)
+        x = x - x1 * math.cos(rel_orientation_rad)
+        y = y - y1 * math.sin(rel_orientation_rad)
 
         position = np.array([x, y, z])
 
@@ -99,22 +99,15 @@ class EnrichMaterial(ITask):
         """enrich layer"""
         invalid_layer_sets = [layer_set for layer_set in
                               invalid_layer.to_layerset]
-        type_invalid_instances = self.get_invalid_instances_type(
-            invalid_layer_sets)
-        if len(type_invalid_instances) == 1:
-            specific_instance_template = templates[list(
-                templates.keys())[0]][type_invalid_instances[0]]
-            resumed_names = list(set(
-                layer['material']['name'] for layer in
-                specific_instance_template['layer'].values()))
-        else:
-            resumed_names = list(resumed.keys())
         layer = Layer()
         layer.thickness = invalid_layer.thickness
         material_name = invalid_layer.material.name
         if material_name in self.template_materials:
             material = self.template_materials[material_name]
         else:
+            # candidate names are only needed for not yet known materials
+            resumed_names = self.get_resumed_names(
+                invalid_layer_sets, resumed, templates)
             specific_template = yield from self.get_material_template(
                 material_name, resumed_names, resumed)
             material = self.create_material_from_template(specific_template)
@@ -126,16 +119,28 @@ class EnrichMaterial(ITask):
             layer_set.layers[layer_set.layers.index(invalid_layer)] = layer
         return layer
 
+    @classmethod
+    def get_resumed_names(cls, layer_sets, resumed, templates):
+        """get names of the material templates a layer material is searched
+        in"""
+        type_invalid_instances = cls.get_invalid_instances_type(layer_sets)
+        if len(type_invalid_instances) == 1:
+            specific_instance_template = templates[list(
+                templates.keys())[0]][type_invalid_instances[0]]
+            return list(set(
+                layer['material']['name'] for layer in
+                specific_instance_template['layer'].values()))
+        return list(resumed.keys())
+
     @staticmethod
     def get_invalid_instances_type(layer_sets):
         """get invalid instances"""
-        invalid_instances = []
+        # dict as insertion ordered set of type names
+        invalid_instances = {}
         for layer_set in layer_sets:
             for parent in layer_set.parents:
-                instance_type = type(parent).__name__
-                if instance_type not in invalid_instances:
-                    invalid_instances.append(instance_type)
-        return invalid_instances
+                invalid_instances[type(parent).__name__] = None
+        return list(invalid_instances)
 
     @classmethod
     def get_material_template(cls, material_name: str, resumed_names: list,
@@ -259,29 +264,24 @@ class EnrichMaterial(ITask):
         """get dict with the material templates and its respective attributes"""
         material_templates = get_material_templates()
         resumed = {}
-        for k in material_templates:
-            resumed[material_templates[k]['name']] = {}
+        for template in material_templates.values():
+            resumed[template['name']] = attributes = {}
             if attrs is not None:
                 for attr in attrs:
                     if attr == 'thickness':
-                        resumed[material_templates[k]['name']][attr] = \
-                            material_templates[k]['thickness_default']
+                        attributes[attr] = template['thickness_default']
                     else:
-                        resumed[material_templates[k]['name']][attr] = \
-                            material_templates[k][attr]
+                        attributes[attr] = template[attr]
             else:
-                for attr in material_templates[k]:
+                for attr, value in template.items():
                     if attr == 'thickness_default':
-                        resumed[material_templates[k]['name']]['thickness'] = \
-                            material_templates[k][attr]
+                        attributes['thickness'] = value
                     elif attr == 'name':
-                        resumed[material_templates[k]['name']]['material'] = \
-                            material_templates[k][attr]
+                        attributes['material'] = value
                     elif attr == 'thickness_list':
                         continue
                     else:
-                        resumed[material_templates[k]['name']][attr] = \
-                            material_templates[k][attr]
+                        attributes[attr] = value
         return resumed
 
     @staticmethod
@@ -289,23 +289,23 @@ class EnrichMaterial(ITask):
         """get patterns for a material name in both english and original language,
         and get afterwards the related elements from list"""
 
-        material_ref = []
+        pattern_material = []
 
         if type(search_words) is str:
             pattern_material = search_words.split()
             translated = translate_deep(search_words)
             if translated:
                 pattern_material.extend(translated.split())
-            for i in pattern_material:
-                material_ref.append(
-                    re.compile('(.*?)%s' % i, flags=re.IGNORECASE))
 
-        material_options = []
-        for ref in material_ref:
-            for mat in search_list:
-                if ref.match(mat):
-                    if mat not in material_options:
-                        material_options.append(mat)
+        # case-insensitive substring search, dict as insertion ordered set
+        lower_list = [(mat.lower(), mat) for mat in search_list]
+        material_options = {}
+        for word in pattern_material:
+            word = word.lower()
+            for lower_mat, mat in lower_list:
+                if word in lower_mat:
+                    material_options[mat] = None
+        material_options = list(material_options)
         if len(material_options) == 0:
             return search_list
         return material_options
@@ -130,8 +130,10 @@ class Prepare(ITask):
         # when decomposed,decomposes instance has attributes of the decomposed
         # instance
         if len(d_instance.space_boundaries):
+            known_sbs = set(instance.space_boundaries)
             for sb in d_instance.space_boundaries:
-                if sb not in instance.space_boundaries:
+                if sb not in known_sbs:
+                    known_sbs.add(sb)
                     instance.space_boundaries.append(sb)
 
         for tz in d_instance.thermal_zones:
@@ -139,8 +141,7 @@ class Prepare(ITask):
                 instance.thermal_zones.append(tz)
             if instance not in tz.bound_elements:
                 tz.bound_elements.append(instance)
-            d_instance_index = tz.bound_elements.index(d_instance)
-            del tz.bound_elements[d_instance_index]
+            tz.bound_elements.remove(d_instance)
 
         for attr, (value, available) in instance.attributes.items():
             if not value and hasattr(d_instance, attr):
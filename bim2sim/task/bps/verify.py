@@ -12,6 +12,8 @@ class Verification(ITask):
 
     reads = ('instances',)
     touches = ('invalid',)
+    # material attributes that are invalid if missing or not positive
+    material_blacklist = ('density', 'spec_heat_capacity', 'thermal_conduc')
 
     def __init__(self):
         super().__init__()
@@ -39,18 +41,20 @@ class Verification(ITask):
 
     def materials_verification(self, materials):
         """checks validity of the material property values"""
-        invalid_layers = []
+        # dict as insertion ordered set of layers
+        invalid_layers = {}
         for material in materials:
             invalid = False
-            for attr in material.attributes:
+            # only blacklisted attributes can fail, skip resolving the others
+            for attr in self.material_blacklist:
+                if attr not in material.attributes:
+                    continue
                 value = getattr(material, attr)
                 if not self.value_verification(attr, value):
                     invalid = True
                     break
             if invalid:
-                for layer in material.parents:
-                    if layer not in invalid_layers:
-                        invalid_layers.append(layer)
+                invalid_layers.update(dict.fromkeys(material.parents))
         sorted_layers = list(sorted(invalid_layers,
                                     key=lambda layer_e: layer_e.material.name))
         return sorted_layers
@@ -89,7 +93,7 @@ class Verification(ITask):
     @staticmethod
     def instances_with_layers_verification(instances, lod_low=False):
         invalid_instances = []
-        layer_classes = list(all_subclasses(BPSProductWithLayers))
+        layer_classes = all_subclasses(BPSProductWithLayers)
         for inst in instances.values():
             if type(inst) in layer_classes:
                 if not lod_low:
@@ -102,10 +106,9 @@ class Verification(ITask):
                     invalid_instances.append(inst)
         return invalid_instances
 
-    @staticmethod
-    def value_verification(attr: str, value: ureg.Quantity):
+    @classmethod
+    def value_verification(cls, attr: str, value: ureg.Quantity):
         """checks validity of the properties if they are on the blacklist"""
-        blacklist = ['density', 'spec_heat_capacity', 'thermal_conduc']
-        if (value is None or value <= 0) and attr in blacklist:
+        if (value is None or value <= 0) and attr in cls.material_blacklist:
             return False
         return True
@@ -3,10 +3,10 @@
 import itertools
 import json
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Generator, Iterable, Tuple
 
-import networkx as nx
 import numpy as np
 
 from bim2sim.decision import DecisionBunch
@@ -59,26 +59,40 @@ class ConnectElements(ITask):
         self.logger.info("Connecting the relevant elements")
         self.logger.info(" - Connecting by relations ...")
         all_ports = [port for item in instances.values() for port in item.ports]
+        # positions of all ports are read only once
+        positions = self.port_positions(all_ports)
+        port_index = {port: i for i, port in enumerate(all_ports)}
         rel_connections = self.connections_by_relation(all_ports)
         self.logger.info(" - Found %d potential connections.", len(rel_connections))
         # Check connections
         self.logger.info(" - Checking positions of connections ...")
-        confirmed, unconfirmed, rejected = self.confirm_connections_position(rel_connections)
+        rel_positions = positions[np.array(
+            [[port_index[port1], port_index[port2]]
+             for port1, port2 in rel_connections], dtype=int).reshape(-1, 2)]
+        confirmed, unconfirmed, rejected = self.confirm_connections_position(
+            rel_connections, positions=rel_positions)
         self.logger.info(" - %d connections are confirmed and %d rejected. %d can't be confirmed.",
                          len(confirmed), len(rejected), len(unconfirmed))
+        # connected ports are tracked while connecting
+        connected = np.zeros(len(all_ports), dtype=bool)
         for port1, port2 in confirmed + unconfirmed:
             # Unconfirmed ports have no position data and can not be connected by position
             port1.connect(port2)
+            connected[port_index[port1]] = connected[port_index[port2]] = True
         # Connect unconnected ports by position
-        unconnected_ports = (port for port in all_ports if not port.is_connected())
+        unconnected_ports = [port for port, is_connected
+                             in zip(all_ports, connected) if not is_connected]
         self.logger.info(" - Connecting remaining ports by position ...")
-        pos_connections = self.connections_by_position(unconnected_ports)
+        pos_connections = self.connections_by_position(
+            unconnected_ports, positions=positions[~connected])
         self.logger.info(" - Found %d additional connections.", len(pos_connections))
         for port1, port2 in pos_connections:
             port1.connect(port2)
+            connected[port_index[port1]] = connected[port_index[port2]] = True
         # Get number of connected and unconnected ports
         nr_total = len(all_ports)
-        unconnected = [port for port in all_ports if not port.is_connected()]
+        unconnected = [port for port, is_connected
+                       in zip(all_ports, connected) if not is_connected]
         nr_unconnected = len(unconnected)
         nr_connected = nr_total - nr_unconnected
         self.logger.info("In total %d of %d ports are connected.", nr_connected, nr_total)
@@ -103,21 +117,30 @@ class ConnectElements(ITask):
             elements: dictionary of elements to be checked with guid as key
         """
         for ele in elements.values():
-            for port_a, port_b in itertools.combinations(ele.ports, 2):
-                if np.allclose(port_a.position, port_b.position, rtol=1e-7, atol=1):
-                    quality_logger.warning("Poor quality of elements %s: "
-                                           "Overlapping ports (%s and %s @%s)",
-                                           ele.ifc, port_a.guid, port_b.guid, port_a.position)
-                    connections = ConnectElements.connections_by_relation([port_a, port_b], include_conflicts=True)
-                    all_ports = [port for connection in connections for port in connection]
-                    other_ports = [port for port in all_ports if port not in [port_a, port_b]]
-                    if port_a in all_ports and port_b in all_ports and len(set(other_ports)) == 1:
-                        # Both ports connected to same other port -> merge ports
-                        quality_logger.info("Removing %s and set %s as SINKANDSOURCE.", port_b.ifc, port_a.ifc)
-                        ele.ports.remove(port_b)
-                        port_b.parent = None
-                        port_a.flow_direction = 0
-                        port_a.flow_master = True
+            ports = list(ele.ports)
+            if len(ports) < 2:
+                continue
+            # overlap of all port pairs at once, same as np.allclose per pair
+            positions = np.array([port.position for port in ports],
+                                 dtype=np.float64)
+            overlap = np.all(
+                np.abs(positions[:, None] - positions[None, :])
+                <= 1 + 1e-7 * np.abs(positions[None, :]), axis=-1)
+            for i, j in zip(*np.nonzero(np.triu(overlap, k=1))):
+                port_a, port_b = ports[i], ports[j]
+                quality_logger.warning("Poor quality of elements %s: "
+                                       "Overlapping ports (%s and %s @%s)",
+                                       ele.ifc, port_a.guid, port_b.guid, port_a.position)
+                connections = ConnectElements.connections_by_relation([port_a, port_b], include_conflicts=True)
+                all_ports = [port for connection in connections for port in connection]
+                other_ports = [port for port in all_ports if port not in [port_a, port_b]]
+                if port_a in all_ports and port_b in all_ports and len(set(other_ports)) == 1:
+                    # Both ports connected to same other port -> merge ports
+                    quality_logger.info("Removing %s and set %s as SINKANDSOURCE.", port_b.ifc, port_a.ifc)
+                    ele.ports.remove(port_b)
+                    port_b.parent = None
+                    port_a.flow_direction = 0
+                    port_a.flow_master = True
 
     @staticmethod
     def connections_by_relation(ports: list, include_conflicts: bool = False) -> list:
@@ -132,24 +155,31 @@ class ConnectElements(ITask):
         """
         connections = []
         port_mapping = {port.guid: port for port in ports}
+        # read the ifc relations in one pass, before resolving them
+        related_guids = []
         for port in ports:
-            if not port.ifc:
+            port_ifc = port.ifc
+            if not port_ifc:
                 continue
-            connected_ports = [conn.RelatingPort for conn in
-                               port.ifc.ConnectedFrom] + [conn.RelatedPort for
-                                                          conn in
-                                                          port.ifc.ConnectedTo]
-            if connected_ports:
+            guids = [conn.RelatingPort.GlobalId
+                     for conn in port_ifc.ConnectedFrom]
+            guids.extend(conn.RelatedPort.GlobalId
+                         for conn in port_ifc.ConnectedTo)
+            related_guids.append((port, guids))
+
+        get_port = port_mapping.get
+        for port, guids in related_guids:
+            if guids:
                 other_port = None
-                if len(connected_ports) > 1:
+                if len(guids) > 1:
                     # conflicts
                     quality_logger.warning("%s has multiple connections", port.ifc)
                     possibilities = []
-                    for connected_port in connected_ports:
-                        possible_port = port_mapping.get(
-                            connected_port.GlobalId)
-
-                        if possible_port.parent is not None:
+                    for guid in guids:
+                        possible_port = get_port(guid)
+                        # ports outside of the given ports are ignored
+                        if possible_port is not None \
+                                and possible_port.parent is not None:
                             possibilities.append(possible_port)
 
                     # solving conflicts
@@ -165,7 +195,7 @@ class ConnectElements(ITask):
                                                  "Continue without connecting %s", port.ifc)
                 else:
                     # explicit
-                    other_port = port_mapping.get(connected_ports[0].GlobalId)
+                    other_port = get_port(guids[0])
                 if other_port:
                     if port.parent and other_port.parent:
                         connections.append((port, other_port))
@@ -174,7 +204,29 @@ class ConnectElements(ITask):
         return connections
 
     @staticmethod
-    def confirm_connections_position(connections: list, eps: float = 1)\
+    def port_positions(ports: list) -> np.ndarray:
+        """Reads the positions of ports into one array.
+
+        Args:
+            ports: list of ports
+
+        Returns:
+            positions: array of shape (len(ports), 3), rows of ports without
+                position are nan
+        """
+        positions = np.full((len(ports), 3), np.nan)
+        for i, port in enumerate(ports):
+            try:
+                position = port.position
+            except AttributeError:
+                continue
+            if position is not None:
+                positions[i] = position
+        return positions
+
+    @staticmethod
+    def confirm_connections_position(connections: list, eps: float = 1,
+                                     positions: np.ndarray = None)\
             -> Tuple[list, list, list]:
         """Checks distance between port positions.
         If distance < eps, the connection is confirmed otherwise rejected.
@@ -182,21 +234,25 @@ class ConnectElements(ITask):
         Args:
             connections: list of connections to be checked
             eps: distance tolerance for which connections are either confirmed or rejected
+            positions: positions of the connected ports with shape
+                (len(connections), 2, 3), read from the ports if not given
 
         Returns:
             tuple of lists of connections (confirmed, unconfirmed, rejected)
         """
-        confirmed = []
-        unconfirmed = []
-        rejected = []
-        for port1, port2 in connections:
-            delta = ConnectElements.port_distance(port1, port2)
-            if delta is None:
-                unconfirmed.append((port1, port2))
-            elif max(abs(delta)) < eps:
-                confirmed.append((port1, port2))
-            else:
-                rejected.append((port1, port2))
+        if positions is None:
+            positions = ConnectElements.port_positions(
+                [port for connection in connections for port in connection]
+            ).reshape(-1, 2, 3)
+        abs_delta = np.abs(positions[:, 0] - positions[:, 1]).max(
+            axis=-1, initial=0)
+        # nan deltas (missing positions) are neither confirmed nor rejected
+        is_unconfirmed = np.isnan(abs_delta)
+        is_confirmed = abs_delta < eps
+        is_rejected = ~(is_confirmed | is_unconfirmed)
+        confirmed = [connections[i] for i in np.flatnonzero(is_confirmed)]
+        unconfirmed = [connections[i] for i in np.flatnonzero(is_unconfirmed)]
+        rejected = [connections[i] for i in np.flatnonzero(is_rejected)]
         return confirmed, unconfirmed, rejected
 
     @staticmethod
@@ -208,63 +264,139 @@ class ConnectElements(ITask):
             port2: the seconds port
 
         Returns:
-            delta: distance between port1 and port2 in x, y, z coordinates
+            delta: distance between port1 and port2 in x, y, z coordinates,
+                None if a port has no position
         """
-        try:
-            delta = port1.position - port2.position
-        except AttributeError:
-            delta = None
-        return delta
+        position1 = getattr(port1, 'position', None)
+        position2 = getattr(port2, 'position', None)
+        if position1 is None or position2 is None:
+            return None
+        return position1 - position2
 
     @staticmethod
-    def connections_by_position(ports: Generator, eps: float = 10) -> list:
+    def close_port_pairs(ports: Iterable[Port], eps: float,
+                         max_block_size: int = 2 ** 20,
+                         positions: np.ndarray = None) \
+            -> Generator[Tuple[Port, Port, float], None, None]:
+        """Find pairs of ports of different parents which are close together.
+
+        The distances of all port pairs are computed with numpy in blocks of
+        rows, so the temporary arrays hold at most max_block_size distances.
+        Pairs are yielded in the same order as itertools.combinations(ports,
+        2) would yield them.
+
+        Args:
+            ports: ports to search for close pairs, ports without position
+                are ignored
+            eps: distance tolerance (maximum delta in x, y, z)
+            max_block_size: number of pair distances computed at once
+            positions: positions of the ports as returned by port_positions,
+                read from the ports if not given
+
+        Yields:
+            port1, port2, abs_delta: close ports and their maximum delta in
+                x, y, z
+        """
+        ports = list(ports)
+        if positions is None:
+            positions = ConnectElements.port_positions(ports)
+        has_position = ~np.isnan(positions).any(axis=1)
+        ports = [port for port, valid in zip(ports, has_position) if valid]
+        positions = positions[has_position]
+        n = len(ports)
+        if n < 2:
+            return
+        parents = np.array([id(port.parent) for port in ports])
+        indices = np.arange(n)
+        # one contiguous array per coordinate, so the deltas of a block are
+        # reduced coordinate by coordinate without an (rows, n, 3) temporary
+        coordinates = [np.ascontiguousarray(column) for column in positions.T]
+        block = max(1, max_block_size // n)
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            # columns before the block can only hold pairs yielded already
+            first = start + 1
+            abs_delta = None
+            for column in coordinates:
+                column_delta = np.abs(
+                    column[start:stop, None] - column[None, first:])
+                if abs_delta is None:
+                    abs_delta = column_delta
+                else:
+                    np.maximum(abs_delta, column_delta, out=abs_delta)
+            # upper triangle only and no connections within one element
+            close = (abs_delta < eps) \
+                & (indices[None, first:] > indices[start:stop, None]) \
+                & (parents[None, first:] != parents[start:stop, None])
+            for i, j in zip(*np.nonzero(close)):
+                yield ports[start + i], ports[first + j], abs_delta[i, j]
+
+    @staticmethod
+    def connections_by_position(ports: Iterable[Port], eps: float = 10,
+                                positions: np.ndarray = None) -> list:
         """Connect ports of instances by computing geometric distance
 
         Args:
             ports:
             eps: distance tolerance for which ports are connected
+            positions: positions of the ports as returned by port_positions,
+                read from the ports if not given
 
         Returns: list of tuples of ports that are connected
 
         """
-        graph = nx.Graph()
-        for port1, port2 in itertools.combinations(ports, 2):
-            if port1.parent == port2.parent:
-                continue
-            delta = ConnectElements.port_distance(port1, port2)
-            if delta is None:
-                continue
-            abs_delta = max(abs(delta))
-            if abs_delta < eps:
-                graph.add_edge(port1, port2, delta=abs_delta)
+        pairs = list(ConnectElements.close_port_pairs(
+            ports, eps, positions=positions))
+        deltas = np.array([delta for _, _, delta in pairs], dtype=np.float64)
+        removed = np.zeros(len(pairs), dtype=bool)
+        # indices of the pairs of each port, ports in order of appearance
+        port_pairs = {}
+        for k, (port1, port2, _) in enumerate(pairs):
+            port_pairs.setdefault(port1, []).append(k)
+            port_pairs.setdefault(port2, []).append(k)
+
+        def other(k, port):
+            port1, port2, _ = pairs[k]
+            return port2 if port1 is port else port1
 
         # verify
-        conflicts = [port for port, deg in graph.degree() if deg > 1]
+        conflicts = [port for port, ks in port_pairs.items() if len(ks) > 1]
         for port in conflicts:
-            candidates = sorted(graph.edges(port, data=True), key=lambda t: t[2].get('delta', eps))
+            candidates = sorted((k for k in port_pairs[port] if not removed[k]),
+                                key=deltas.__getitem__)
             # initially there are at least two candidates, but there will be less, if previous conflicts belong to them
             if len(candidates) <= 1:
                 # no action required
                 continue
             quality_logger.warning(
                 "Found %d geometrically close ports around %s. Details: %s",
-                len(candidates), port, candidates)
-            if candidates[0][2]['delta'] < candidates[1][2]['delta']:
+                len(candidates), port,
+                [(port, other(k, port), deltas[k]) for k in candidates])
+            if deltas[candidates[0]] < deltas[candidates[1]]:
                 # keep first
                 first = 1
                 quality_logger.info(
                     "Accept closest ports with delta %d as connection (%s - %s)",
-                    candidates[0][2]['delta'], candidates[0][0], candidates[0][1])
+                    deltas[candidates[0]], port, other(candidates[0], port))
             else:
                 # remove all
                 first = 0
                 quality_logger.warning(
                     "No connection determined, because there are no two "
                     "closest ports.")
-            for cand in candidates[first:]:
-                graph.remove_edge(cand[0], cand[1])
+            removed[candidates[first:]] = True
 
-        return list(graph.edges())
+        # remaining pairs, each once and starting at the first seen port
+        connections = []
+        seen = set()
+        for port, ks in port_pairs.items():
+            for k in ks:
+                if not removed[k]:
+                    other_port = other(k, port)
+                    if other_port not in seen:
+                        connections.append((port, other_port))
+            seen.add(port)
+        return connections
 
     @staticmethod
     def check_inner_connections(instances: Iterable[ProductBased]) -> Generator[DecisionBunch, None, None]:
@@ -391,6 +523,8 @@ class Reduce(ITask):
             self.logger.info(f"Aggregating {name} ...")
             matches, metas = agg_class.find_matches(graph)
             i = 0
+            # aggregations are created one after another, because each one
+            # determines its edge ports on the graph as merged so far
             for match, meta in zip(matches, metas):
                 try:
                     agg = agg_class(graph, match, **meta)
@@ -430,14 +564,16 @@ class Reduce(ITask):
         """ Set flow_side for ports in graph based on known flow_sides."""
         # TODO: needs testing!
         # TODO: at least one master element required
-        accepted = []
-        while True:
-            unset_port = None
-            for port in graph.get_nodes():
-                if port.flow_side == 0 and graph.graph[port] and port not in accepted:
-                    unset_port = port
-                    break
-            if unset_port:
+        accepted = set()
+        # ports only ever leave the worklist condition (flow_side gets set or
+        # they are accepted), so one pass over the ports in order suffices
+        worklist = deque(port for port in graph.nodes
+                         if port.flow_side == 0 and graph[port])
+        while worklist:
+            unset_port = worklist[0]
+            if unset_port.flow_side != 0 or unset_port in accepted:
+                worklist.popleft()
+            else:
                 side, visited, masters = graph.recurse_set_unknown_sides(
                     unset_port)
                 if side in (-1, 1):
@@ -446,7 +582,7 @@ class Reduce(ITask):
                         port.flow_side = side
                 elif side == 0:
                     # TODO: ask user?
-                    accepted.extend(visited)
+                    accepted.update(visited)
                 elif masters:
                     # ask user to fix conflicts (and retry in next while loop)
                     for port in masters:
@@ -461,11 +597,8 @@ class Reduce(ITask):
                 else:
                     # can not be solved (no conflicting masters)
                     # TODO: ask user?
-                    accepted.extend(visited)
-            else:
-                # done
-                logging.info("Flow_side set")
-                break
+                    accepted.update(visited)
+        logging.info("Flow_side set")
 
 
 class DetectCycles(ITask):
@@ -492,8 +625,6 @@ class Export(ITask):
         self.logger.info("Export to Modelica code")
         reduced_instances = graph.elements
 
-        connections = graph.get_connections()
-
         modelica.Instance.init_factory(libraries)
         export_instances = {inst: modelica.Instance.factory(inst)
                             for inst in reduced_instances}
@@ -533,15 +664,19 @@ class Export(ITask):
         connection_port_names = []
         distributors_n = {}
         distributors_ports = {}
-        for port_a, port_b in graph.edges:
-            if port_a.parent is port_b.parent:
-                # ignore inner connections
-                continue
-            instances = {'a': export_instances[port_a.parent],
-                         'b': export_instances[port_b.parent]}
-            ports_name = {'a': instances['a'].get_full_port_name(port_a),
-                          'b': instances['b'].get_full_port_name(port_b)}
-            if any(isinstance(e.element, hvac.Distributor) for e in instances.values()):
+        get_instance = export_instances.__getitem__
+        # inner connections are ignored
+        for port_a, port_b in graph.get_connections():
+            instance_a = get_instance(port_a.parent)
+            instance_b = get_instance(port_b.parent)
+            port_name_a = instance_a.get_full_port_name(port_a)
+            port_name_b = instance_b.get_full_port_name(port_b)
+            if not isinstance(instance_a.element, hvac.Distributor) \
+                    and not isinstance(instance_b.element, hvac.Distributor):
+                connection_port_names.append((port_name_a, port_name_b))
+            else:
+                instances = {'a': instance_a, 'b': instance_b}
+                ports_name = {'a': port_name_a, 'b': port_name_b}
                 for key, inst in instances.items():
                     if type(inst.element) is hvac.Distributor:
                         distributor = (key, inst)
@@ -553,8 +688,8 @@ class Export(ITask):
                 ports_name[distributor[0]] = distributor[1].get_new_port_name(
                     distributor[1], other_inst, distributor_port, other_port,
                     distributors_n, distributors_ports)
-
-            connection_port_names.append((ports_name['a'], ports_name['b']))
+                connection_port_names.append(
+                    (ports_name['a'], ports_name['b']))
 
         for distributor in distributors_n:
             distributor.params['n'] = int(distributors_n[distributor] / 2 - 1)
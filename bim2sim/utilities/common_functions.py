@@ -1,22 +1,25 @@
 import collections
 import json
 import math
+import os
 import re
 from pathlib import Path
-from typing import Union
+from typing import Dict, Tuple, Union
 
 import bim2sim
 
 assets = Path(bim2sim.__file__).parent / 'assets'
 
+# raw content of loaded json files keyed by (path, modification time)
+_json_cache: Dict[Tuple[str, float], bytes] = {}
+# successful translations keyed by (text, source, target)
+_translation_cache: Dict[Tuple[str, str, str], str] = {}
+
 
 def angle_equivalent(angle):
-    while angle >= 360 or angle < 0:
-        if angle >= 360:
-            angle -= 360
-        elif angle < 0:
-            angle += 360
-    return angle
+    angle = angle % 360
+    # tiny negative angles are rounded up to 360 by the modulo
+    return angle if angle < 360 else angle - 360
 
 
 def vector_angle(vector):
@@ -63,6 +66,30 @@ def validateJSON(json_data: Union[str, Path, ]):
     return True
 
 
+def load_json(json_path: Union[str, Path]) -> dict:
+    """Load json file and return its parsed content.
+
+    The raw file content is cached by path and modification time, so repeated
+    loads of the same file skip the disk access. Each call returns a new
+    object, which may be modified by the caller.
+
+    Raises:
+        ValueError: if the file is no valid json
+    """
+    json_path = str(json_path)
+    key = (json_path, os.path.getmtime(json_path))
+    raw = _json_cache.get(key)
+    if raw is None:
+        with open(json_path, 'rb') as file:
+            raw = file.read()
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        raise ValueError(f"Invalid JSON file  {json_path}")
+    _json_cache[key] = raw
+    return data
+
+
 def get_usage_dict(prj_name) -> dict:
     custom_usage_path = assets / 'enrichment/usage' / \
                         ('UseConditions' + prj_name + '.json')
@@ -70,23 +97,14 @@ def get_usage_dict(prj_name) -> dict:
         usage_path = custom_usage_path
     else:
         usage_path = assets / 'enrichment/usage/UseConditions.json'
-    if validateJSON(usage_path):
-        with open(usage_path, 'r+', encoding='utf-8') as file:
-            usage_dict = json.load(file)
-            del usage_dict['version']
-            return usage_dict
-    else:
-        raise ValueError(f"Invalid JSON file  {usage_path}")
+    usage_dict = load_json(usage_path)
+    del usage_dict['version']
+    return usage_dict
 
 
 def get_common_pattern_usage() -> dict:
     common_pattern_path = assets / 'enrichment/usage/commonUsages.json'
-    if validateJSON(common_pattern_path):
-        with open(common_pattern_path, 'r+', encoding='utf-8') as file:
-            common_usages = json.load(file)
-            return common_usages
-    else:
-        raise ValueError(f"Invalid JSON file  {common_pattern_path}")
+    return load_json(common_pattern_path)
 
 
 def get_custom_pattern_usage(prj_name) -> dict:
@@ -98,14 +116,10 @@ def get_custom_pattern_usage(prj_name) -> dict:
         custom_pattern_path = custom_pattern_path_prj
     else:
         custom_pattern_path = assets / 'enrichment/usage/customUsages.json'
-    if validateJSON(custom_pattern_path):
-        with open(custom_pattern_path, 'r+', encoding='utf-8') as file:
-            custom_usages_json = json.load(file)
-            if custom_usages_json["settings"]["use"]:
-                custom_usages = custom_usages_json["usage_definitions"]
-            return custom_usages
-    else:
-        raise ValueError(f"Invalid JSON file  {custom_pattern_path}")
+    custom_usages_json = load_json(custom_pattern_path)
+    if custom_usages_json["settings"]["use"]:
+        custom_usages = custom_usages_json["usage_definitions"]
+    return custom_usages
 
 
 def get_pattern_usage(prj_name):
@@ -169,12 +183,8 @@ def combine_usages(common_usages, custom_usages) -> dict:
 def get_type_building_elements():
     type_building_elements_path = \
         assets / 'enrichment/material/TypeBuildingElements.json'
-    if validateJSON(type_building_elements_path):
-        with open(type_building_elements_path, 'r+') as file:
-            type_building_elements = json.load(file)
-            del type_building_elements['version']
-    else:
-        raise ValueError(f"Invalid JSON file  {type_building_elements_path}")
+    type_building_elements = load_json(type_building_elements_path)
+    del type_building_elements['version']
     template_options = {}
     for i in type_building_elements:
         i_name, i_years, i_template = i.split('_')
@@ -190,12 +200,8 @@ def get_type_building_elements():
 def get_material_templates():
     material_templates_path = \
         assets / 'enrichment/material/MaterialTemplates.json'
-    if validateJSON(material_templates_path):
-        with open(material_templates_path, 'r+') as f:
-            material_templates = json.load(f)
-            del material_templates['version']
-    else:
-        raise ValueError(f"Invalid JSON file  {material_templates_path}")
+    material_templates = load_json(material_templates_path)
+    del material_templates['version']
     return material_templates
 
 
@@ -203,12 +209,8 @@ def get_type_building_elements_hvac():
     # todo: still needed?
     type_building_elements_path = \
         assets / 'enrichment/hvac/TypeHVACElements.json'
-    if validateJSON(type_building_elements_path):
-        with open(type_building_elements_path, 'r+') as file:
-            type_building_elements = json.load(file)
-            del type_building_elements['version']
-    else:
-        raise ValueError(f"Invalid JSON file  {type_building_elements_path}")
+    type_building_elements = load_json(type_building_elements_path)
+    del type_building_elements['version']
     return type_building_elements
 
 
@@ -226,8 +228,15 @@ def filter_instances(instances: Union[dict, list], type_name) -> list:
     list_instances = instances.values() if type(instances) is dict \
         else instances
     if isinstance(type_name, str):
+        # resolve the name check once per class, not once per instance
+        type_matches = {}
         for instance in list_instances:
-            if type_name in type(instance).__name__:
+            instance_type = type(instance)
+            match = type_matches.get(instance_type)
+            if match is None:
+                match = type_name in instance_type.__name__
+                type_matches[instance_type] = match
+            if match:
                 instances_filtered.append(instance)
     else:
         for instance in list_instances:
@@ -265,15 +274,24 @@ def remove_umlaut(string):
 
 def translate_deep(text, source='auto', target='en'):
     """ translate function that uses deep_translator package with
-    Google Translator"""
+    Google Translator
+
+    Successful translations are cached, so each text is requested only once
+    per process. Failed requests are not cached and retried on the next call.
+    """
     # return False  # test no internet
+    key = (text, source, target)
+    if key in _translation_cache:
+        return _translation_cache[key]
     try:
         from deep_translator import GoogleTranslator
         translated = GoogleTranslator(
             source=source, target=target).translate(text=text)
-        return translated
     except:
         return False
+    if translated:
+        _translation_cache[key] = translated
+    return translated
     # proxies_example = {
     #     "https": "34.195.196.27:8080",
     #     "http": "34.195.196.27:8080"
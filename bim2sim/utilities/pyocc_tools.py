@@ -6,6 +6,7 @@ from typing import List, Tuple, Union
 import numpy as np
 from OCC.Core.BRep import BRep_Tool
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.BRepBndLib import brepbndlib_Add
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace, \
     BRepBuilderAPI_Transform, BRepBuilderAPI_MakePolygon, \
     BRepBuilderAPI_MakeShell, BRepBuilderAPI_MakeSolid
@@ -14,6 +15,7 @@ from OCC.Core.BRepGProp import brepgprop_SurfaceProperties, \
     brepgprop_LinearProperties, brepgprop_VolumeProperties
 from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 from OCC.Core.BRepTools import BRepTools_WireExplorer
+from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.Geom import Handle_Geom_Plane_DownCast
 from OCC.Core.ShapeAnalysis import ShapeAnalysis_ShapeContents
@@ -435,9 +437,16 @@ class PyOCCTools:
 
         Returns: True if obj2 is in obj1, else False
         """
+        obj2_center = PyOCCTools.get_center_of_volume(obj2)
+        # a center outside of the bounding box can not be in the solid, this
+        # saves building the solid and classifying the point
+        obj1_box = Bnd_Box()
+        brepbndlib_Add(obj1, obj1_box)
+        obj1_box.Enlarge(1e-6)
+        if obj1_box.IsOut(obj2_center):
+            return False
         faces = PyOCCTools.get_faces_from_shape(obj1)
         shell = PyOCCTools.make_shell_from_faces(faces)
         obj1_solid = PyOCCTools.make_solid_from_shell(shell)
-        obj2_center = PyOCCTools.get_center_of_volume(obj2)
 
         return PyOCCTools.check_pnt_in_solid(obj1_solid, obj2_center)
@@ -51,6 +51,18 @@ class TestAggregation(unittest.TestCase):
         self.assertEqual(2, agg.attr2)
         self.assertEqual(3, agg.attr3)
 
+    def test_reproducible_guid(self):
+        sample1 = SampleElement(attr1=5)
+        sample2 = SampleElement(attr1=15)
+
+        agg1 = SampleElementAggregation([sample1, sample2])
+        agg2 = SampleElementAggregation([sample2, sample1])
+        agg3 = SampleElementAggregation([sample1])
+
+        self.assertEqual(agg1.guid, agg2.guid)
+        self.assertNotEqual(agg1.guid, agg3.guid)
+        self.assertEqual(22, len(agg1.guid))
+
 
 # --- domain Aggregations ---
 
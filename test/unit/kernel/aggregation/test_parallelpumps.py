@@ -559,6 +559,30 @@ class TestParallelPumps(unittest.TestCase):
                               [mapping[models[0].ports[0]],
                                mapping[models[-1].ports[1]]])
 
+    def test_pump_setup1_nested_aggregation(self):
+        """ Two parallel pumps with a nested aggregation of two pipes."""
+        graph, flags = self.helper.get_setup_pumps1()
+        models = flags['pumps1']
+        matches, meta = aggregation.ParallelPump.find_matches(graph)
+        agg_pump = aggregation.ParallelPump(graph, matches[0], **meta[0])
+        # both pipes of the first pump strand belong to the same aggregation
+        pipes = [item for item in models if isinstance(item, hvac.Pipe)][:2]
+        nested_graph = graph.subgraph(
+            [port for pipe in pipes for port in pipe.ports])
+        nested = aggregation.PipeStrand(graph, nested_graph)
+        self.assertTrue(all(pipe.aggregation is nested for pipe in pipes))
+
+        mapping = agg_pump.get_replacement_mapping()
+        for port in nested.ports:
+            for original in port.originals:
+                self.assertIs(mapping[original], port)
+        self.assertCountEqual(
+            [*agg_pump.ports, *nested.ports],
+            [port for port in mapping.values() if port is not None])
+        element_ports = [port for element in agg_pump.elements
+                         for port in element.ports]
+        self.assertCountEqual(element_ports, mapping.keys())
+
     def test_pump_setup2(self):
         """ Five parallel pumps."""
         graph, flags = self.helper.get_setup_pumps2()
@@ -405,7 +405,7 @@ class TestPipeStrand(unittest.TestCase):
         graph, flags = self.helper.get_setup_strand1()
 
         matches, metas = aggregation.PipeStrand.find_matches(graph)
-        agg = aggregation.PipeStrand(graph, matches[0], metas[0])
+        agg = aggregation.PipeStrand(graph, matches[0], **metas[0])
         edge_ports = [edge_port.originals[0] for edge_port in agg.get_ports()]
         self.assertEqual(set(flags['edge_ports']), set(edge_ports))
 
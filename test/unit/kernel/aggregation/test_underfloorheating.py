@@ -123,6 +123,49 @@ class TestUnderfloorHeating(unittest.TestCase):
         self.assertAlmostEqual(.2 * ureg.meter, agg.y_spacing, 1)
         self.assertAlmostEqual(.24 * ureg.meter, agg.x_spacing, 2)
 
+    def test_ports_coordinates(self):
+        """ Test port coordinates with incomplete pipes."""
+        x_pipes = [self.helper.element_generator(
+            hvac.Pipe, length=5, diameter=15) for i in range(3)]
+        y_pipes = [self.helper.element_generator(
+            hvac.Pipe, length=.2, diameter=15) for i in range(2)]
+        chain = self.helper.connect_ufh(
+            x_pipes, y_pipes, 5 * ureg.meter, .2 * ureg.meter)
+        ports_coors, pipe_ports_coors = \
+            aggregation.UnderfloorHeating.get_ports_coordinates(chain)
+        n_ports = 2 * len(chain)
+        self.assertEqual((n_ports, 3), ports_coors.shape)
+        self.assertEqual((len(chain), 2, 3), pipe_ports_coors.shape)
+        np.testing.assert_array_equal(
+            [[port.position for port in pipe.ports] for pipe in chain],
+            pipe_ports_coors)
+
+        # pipes with one or three ports are left out
+        one_port_pipe = self.helper.element_generator(
+            hvac.Pipe, n_ports=1, length=1, diameter=15)
+        three_port_pipe = self.helper.element_generator(
+            hvac.Pipe, n_ports=3, length=1, diameter=15)
+        for port in [*one_port_pipe.ports, *three_port_pipe.ports]:
+            port.position = np.array([0.0, 0.0, 0.0])
+        ports_coors, pipe_ports_coors = \
+            aggregation.UnderfloorHeating.get_ports_coordinates(
+                [*chain, one_port_pipe, three_port_pipe])
+        self.assertEqual((n_ports + 4, 3), ports_coors.shape)
+        self.assertEqual((len(chain), 2, 3), pipe_ports_coors.shape)
+
+    def test_pipe_strand_spacing_one_orientation(self):
+        """ Test spacing of parallel pipes in only one orientation."""
+        pipe_ports_coors = np.array(
+            [[[0, 200 * i, 0], [5000, 200 * i, 0]] for i in range(20)],
+            dtype=np.float64)
+        x_spacing, y_spacing = \
+            aggregation.UnderfloorHeating.get_pipe_strand_spacing(
+                pipe_ports_coors, 5 * ureg.meter, 4 * ureg.meter)
+        self.assertEqual(0 * ureg.meter, x_spacing)
+        self.assertEqual(0 * ureg.meter, y_spacing)
+        self.assertIsNone(
+            aggregation.UnderfloorHeating.check_spacing(x_spacing, y_spacing))
+
 
 if __name__ == '__main__':
     unittest.main()
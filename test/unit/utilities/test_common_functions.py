@@ -107,6 +107,15 @@ class TestCommonFunctions(unittest.TestCase):
             material_templates[
                 '245ce424-3a43-11e7-8714-2cd444b2e704']['heat_capac'], 0.84)
 
+    def test_load_json_returns_independent_copies(self):
+        """test load_json function returns a new object on cached loads"""
+        path = cf.assets / 'enrichment/material/MaterialTemplates.json'
+        first = cf.load_json(path)
+        del first['version']
+        second = cf.load_json(path)
+        self.assertIn('version', second)
+        self.assertEqual(len(first) + 1, len(second))
+
     def test_filter_instances(self):
         """test filter_instances function"""
         wall_1 = Wall()